@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+import hashlib
+from types import MappingProxyType
 from typing import Annotated
 
 from starlette.requests import Request
@@ -10,20 +12,37 @@ app = Server()
 auth = Auth()
 
 
+def _hash_api_key(api_key: bytes) -> bytes:
+    """Hash an API key to a fixed-size digest."""
+    return hashlib.blake2b(api_key, digest_size=16).digest()
+
+
+# Keyed by the digest of each API key so that lookups always hash a fixed-size
+# value, regardless of the length of the key that was sent. Built once at
+# import time.
+API_KEY_TO_USER = MappingProxyType(
+    {
+        _hash_api_key(b"1"): {
+            "permissions": ["authenticated", "group1"],
+            "identity": "some-user",
+        },
+        _hash_api_key(b"2"): {
+            "permissions": ["authenticated", "group2"],
+            "identity": "another-user",
+        },
+    }
+)
+
+
 @auth.authenticate
 async def authenticate(headers: dict[bytes, bytes]) -> dict:
     """Authenticate incoming requests."""
     # Replace this with actual authentication logic.
     api_key = headers.get(b"x-api-key")
-
-    api_key_to_user = {
-        b"1": {"permissions": ["authenticated", "group1"], "identity": "some-user"},
-        b"2": {"permissions": ["authenticated", "group2"], "identity": "another-user"},
-    }
-
-    if not api_key or api_key not in api_key_to_user:
+    user = API_KEY_TO_USER.get(_hash_api_key(api_key)) if api_key else None
+    if user is None:
         raise auth.exceptions.HTTPException(detail="Not authorized")
-    return api_key_to_user[api_key]
+    return user
 
 
 # At the moment this has to be done after registering the authenticate handler.
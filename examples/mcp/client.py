@@ -30,4 +30,9 @@ async def main():
 if __name__ == "__main__":
     import sys
 
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -7,11 +7,17 @@ import asyncio
 import json
 import os
 import sys
+import time
+from collections import defaultdict
+from functools import lru_cache
 from importlib import metadata
-from itertools import chain
-from typing import Any, Literal, Sequence
+from operator import itemgetter
+from typing import Any, Hashable, Literal, Sequence
 
+import orjson
+import pydantic_core
 from mcp import stdio_server
+from mcp.server.fastmcp.utilities.types import Image
 from mcp.server.lowlevel import Server as MCPServer
 from mcp.server.sse import SseServerTransport
 from mcp.types import EmbeddedResource, ImageContent, TextContent, Tool
@@ -30,10 +36,13 @@ class Colors:
     END = "\033[0m"
 
 
+# Check once whether stdout is a terminal and if the terminal supports colors
+_USE_COLOR = sys.stdout.isatty() and os.environ.get("TERM") != "dumb"
+
+
 def print_error(message: str) -> None:
     """Print an error message in red if terminal supports colors."""
-    # Check if stdout is a terminal and if the terminal supports colors
-    if sys.stdout.isatty() and os.environ.get("TERM") != "dumb":
+    if _USE_COLOR:
         print(f"{Colors.RED}Error: {message}{Colors.END}")
     else:
         print(f"Error: {message}")
@@ -48,48 +57,143 @@ SPLASH = """\
     ╚═════╝ ╚══════╝╚═╝     ╚═╝ ╚═════╝╚═╝
 """
 
+# Static output is encoded once rather than on every write.
+_SPLASH_BYTES = f"\n\n{SPLASH}\n\n".encode()
+
+
+def _write_bytes(data: bytes) -> None:
+    """Write pre-encoded bytes to stdout, bypassing the text encoder."""
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout has been replaced by a text-only stream.
+        sys.stdout.write(data.decode())
+    else:
+        buffer.write(data)
+    sys.stdout.flush()
+
+
+class _TTLCache:
+    """A minimal in-memory cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry if the cache is full."""
+        self._data.pop(key, None)
+        if len(self._data) >= self._maxsize:
+            # Dicts preserve insertion order, so the first key is the oldest.
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self._ttl, value)
+
+
+@lru_cache(maxsize=None)
+def _parse_version(version: str) -> tuple[int, ...]:
+    """Parse a semver string (e.g., "1.2.3") into a tuple of integers."""
+    return tuple(map(int, version.split(".")))
+
+
+def _get_latest_tools(server_tools: list[dict]) -> dict[str, dict]:
+    """Map each tool name to the definition of its latest version.
+
+    Each version string is parsed once, up front, and paired with its tool so
+    the per-name `max` compares precomputed tuples via a C-level key function.
+    """
+    groups: defaultdict[str, list[tuple[tuple[int, ...], dict]]] = defaultdict(list)
+    for tool in server_tools:
+        groups[tool["name"]].append((_parse_version(tool["version"]), tool))
+
+    version_key = itemgetter(0)
+    return {
+        name: max(versions, key=version_key)[1] for name, versions in groups.items()
+    }
+
+
+_CONTENT_TYPES = (TextContent, ImageContent, EmbeddedResource)
+
 
 def _convert_to_content(
     result: Any,
 ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     """Convert a result to a sequence of content objects."""
     # This code comes directly from the FastMCP server.
-    # Imported here as it is a private function.
-    import pydantic_core
-    from mcp.server.fastmcp.utilities.types import Image
-    from mcp.types import EmbeddedResource, ImageContent, TextContent
-
+    # Copied here as it is a private function.
     if result is None:
         return []
 
-    if isinstance(result, (TextContent, ImageContent, EmbeddedResource)):
+    if isinstance(result, _CONTENT_TYPES):
         return [result]
 
     if isinstance(result, Image):
         return [result.to_image_content()]
 
     if isinstance(result, (list, tuple)):
-        return list(chain.from_iterable(_convert_to_content(item) for item in result))
+        # Handle the common item types inline to avoid a recursive call per item.
+        content: list[TextContent | ImageContent | EmbeddedResource] = []
+        append = content.append
+        for item in result:
+            if isinstance(item, str):
+                append(TextContent.model_construct(type="text", text=item))
+            elif isinstance(item, _CONTENT_TYPES):
+                append(item)
+            else:
+                content.extend(_convert_to_content(item))
+        return content
 
     if not isinstance(result, str):
         try:
-            result = json.dumps(pydantic_core.to_jsonable_python(result))
+            result = orjson.dumps(
+                result,
+                default=pydantic_core.to_jsonable_python,
+                option=orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects some values the standard encoder handles, e.g.,
+            # integers outside of the 64-bit range.
+            try:
+                result = json.dumps(pydantic_core.to_jsonable_python(result))
+            except Exception:
+                result = str(result)
         except Exception:
             result = str(result)
 
-    return [TextContent(type="text", text=result)]
+    return [TextContent.model_construct(type="text", text=result)]
 
 
 async def create_mcp_server(
-    client: AsyncClient, *, tools: list[str] | None = None
+    client: AsyncClient,
+    *,
+    tools: list[str] | None = None,
+    cache_tools: list[str] | None = None,
+    cache_ttl: float = 60.0,
 ) -> MCPServer:
     """Create MCP server.
 
     Args:
         client: AsyncClient instance.
         tools: If provided, only the tools on this list will be available.
+        cache_tools: Names of tools whose results may be cached and reused for
+            identical arguments. Only list tools that are deterministic and do not
+            depend on the caller (e.g., tools that use an injected request).
+        cache_ttl: Number of seconds a cached tool result remains valid.
     """
     tools = tools or []
+    cache_tools = frozenset(cache_tools or [])
+    result_cache = _TTLCache(maxsize=10_000, ttl=cache_ttl)
     for tool in tools:
         if "@" in tool:
             raise NotImplementedError("Tool versions are not yet supported.")
@@ -97,25 +201,15 @@ async def create_mcp_server(
     server = MCPServer(name="OTC-MCP Bridge")
     server_tools = await client.tools.list()
 
-    latest_tool = {}
-
-    for tool in server_tools:
-        version = tool["version"]
-        # version is semver 3 tuple
-        version_tuple = tuple(map(int, version.split(".")))
-        current_version = latest_tool.get(tool["name"], (0, 0, 0))
-
-        if version_tuple > current_version:
-            latest_tool[tool["name"]] = version_tuple
-
+    # Tool definitions come from the tool server, which already validated them,
+    # so skip pydantic validation when building the MCP models.
     available_tools = [
-        Tool(
+        Tool.model_construct(
             name=tool["name"],
             description=tool["description"],
             inputSchema=tool["input_schema"],
         )
-        for tool in server_tools
-        if tuple(map(int, tool["version"].split("."))) == latest_tool[tool["name"]]
+        for tool in _get_latest_tools(server_tools).values()
     ]
 
     if tools:
@@ -143,12 +237,22 @@ async def create_mcp_server(
         # We'll send a None for the request object.
         # This means that if Auth is enabled, the MCP endpoint will not
         # list any tools that require authentication.
+        cacheable = name in cache_tools
+        if cacheable:
+            cache_key = (name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+            cached = result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         response = await client.tools.call(name, arguments)
         if not response["success"]:
             raise NotImplementedError(
                 "Support for error messages is not yet implemented."
             )
-        return _convert_to_content(response["value"])
+        content = _convert_to_content(response["value"])
+        if cacheable:
+            result_cache.set(cache_key, content)
+        return content
 
     return server
 
@@ -164,11 +268,13 @@ async def run_server_stdio(server: MCPServer) -> None:
 
 
 async def run_starlette(server: MCPServer, *, host: str, port: int) -> None:
-    """Run as a Starlette server exposing /sse endpoint."""
+    """Run as a Starlette server exposing /sse and /ws endpoints."""
     import uvicorn
+    from mcp.server.websocket import websocket_server
     from starlette.applications import Starlette
     from starlette.requests import Request
-    from starlette.routing import Mount, Route
+    from starlette.routing import Mount, Route, WebSocketRoute
+    from starlette.websockets import WebSocket
 
     sse = SseServerTransport("/messages/")
 
@@ -180,10 +286,21 @@ async def run_starlette(server: MCPServer, *, host: str, port: int) -> None:
                 streams[0], streams[1], server.create_initialization_options()
             )
 
+    async def handle_ws(websocket: WebSocket):
+        # Client messages arrive as frames on a single connection instead of
+        # one HTTP POST to /messages/ per message.
+        async with websocket_server(
+            websocket.scope, websocket.receive, websocket.send
+        ) as streams:
+            await server.run(
+                streams[0], streams[1], server.create_initialization_options()
+            )
+
     starlette_app = Starlette(
         routes=[
             Route("/sse", endpoint=handle_sse),
             Mount("/messages/", app=sse.handle_post_message),
+            WebSocketRoute("/ws", endpoint=handle_ws),
         ],
     )
 
@@ -200,63 +317,57 @@ async def run_starlette(server: MCPServer, *, host: str, port: int) -> None:
 
 async def display_tools_table(*, url: str, headers: dict | None) -> None:
     """Connect to server and display available tools in a tabular format."""
-    client = get_async_client(url=url, headers=headers)
     print(f"\nConnecting to server at {url}...\n")
 
-    try:
-        server_tools = await client.tools.list()
-
-        if not server_tools:
-            print("No tools available.")
-            return
-
-        # Find the longest tool name for formatting
-        max_name_length = max(len(tool["name"]) for tool in server_tools)
-
-        # Print table header
-        print(f"{'NAME':<{max_name_length + 2}}| DESCRIPTION")
-        print(f"{'-' * (max_name_length + 2)}|{'-' * 70}")
-
-        # Group tools by name and get the latest version of each
-        latest_tools = {}
-
-        for tool in server_tools:
-            name = tool["name"]
-            version = tool["version"]
-            version_tuple = tuple(map(int, version.split(".")))
-
-            if name not in latest_tools or version_tuple > latest_tools[name][0]:
-                latest_tools[name] = (version_tuple, tool)
-
-        # Sort tools by name
-        for name in sorted(latest_tools.keys()):
-            tool = latest_tools[name][1]
-
-            description = tool["description"].strip()
-            if not description:
-                print(f"{tool['name']:<{max_name_length + 2}}| [No description]")
-                print()
-                continue
-
-            # Split description by newlines to preserve original line breaks
-            desc_lines = description.split("\n")
-            first_line = True
-
-            for line in desc_lines:
-                if first_line:
-                    # Print first line with the tool name
-                    print(f"{tool['name']:<{max_name_length + 2}}| {line}")
-                    first_line = False
-                else:
-                    # Print remaining lines with proper indentation relative to the column
-                    print(f"{' ' * (max_name_length + 2)}| {line}")
-
-            # Add a small gap between tools
-            print()
+    async with get_async_client(url=url, headers=headers) as client:
+        try:
+            server_tools = await client.tools.list()
 
-    except Exception as e:
-        print_error(f"Failed to list tools: {str(e)}")
-        sys.exit(1)
+            if not server_tools:
+                print("No tools available.")
+                return
+
+            # Find the longest tool name for formatting
+            max_name_length = max(len(tool["name"]) for tool in server_tools)
+            name_width = max_name_length + 2
+            indent = " " * name_width
+
+            # Collect the whole table and write it out at once
+            lines = [
+                f"{'NAME':<{name_width}}| DESCRIPTION",
+                f"{'-' * name_width}|{'-' * 70}",
+            ]
+
+            # Group tools by name and get the latest version of each
+            latest_tools = _get_latest_tools(server_tools)
+
+            # Sort tools by name
+            for name in sorted(latest_tools.keys()):
+                tool = latest_tools[name]
+
+                description = tool["description"].strip()
+                if not description:
+                    lines.append(f"{tool['name']:<{name_width}}| [No description]")
+                    lines.append("")
+                    continue
+
+                # Split description by newlines to preserve original line breaks
+                desc_lines = description.split("\n")
+
+                # First line goes next to the tool name
+                lines.append(f"{tool['name']:<{name_width}}| {desc_lines[0]}")
+                # Remaining lines are indented relative to the column
+                lines.extend(f"{indent}| {line}" for line in desc_lines[1:])
+
+                # Add a small gap between tools
+                lines.append("")
+
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+        except Exception as e:
+            print_error(f"Failed to list tools: {str(e)}")
+            sys.exit(1)
 
 
 async def run(
@@ -266,32 +377,43 @@ async def run(
     tools: list[str] | None = None,
     mode: str = Literal["stdio", "sse"],
     sse_settings: dict | None = None,
+    cache_tools: list[str] | None = None,
+    cache_ttl: float = 60.0,
 ) -> None:
     """Run the MCP server in stdio mode."""
-    client = get_async_client(url=url, headers=headers)
-    print()
-    print()
-    print(SPLASH)
-    print()
-    server = await create_mcp_server(client, tools=tools)
-    print()
-    print(f"Connected to {url}")
-
-    if mode == "sse":
-        sse_settings = sse_settings or {}
-        port = sse_settings.get("port", 8000)
-        host = sse_settings.get("host", "localhost")
-        print(f"Running MCP server with SSE endpoint at http://{host}:{port}/sse")
+    async with get_async_client(url=url, headers=headers) as client:
+        _write_bytes(_SPLASH_BYTES)
+        server = await create_mcp_server(
+            client, tools=tools, cache_tools=cache_tools, cache_ttl=cache_ttl
+        )
         print()
-        await run_starlette(server, host=host, port=port)
+        print(f"Connected to {url}")
+
+        if mode == "sse":
+            sse_settings = sse_settings or {}
+            port = sse_settings.get("port", 8000)
+            host = sse_settings.get("host", "localhost")
+            print(f"Running MCP server with SSE endpoint at http://{host}:{port}/sse")
+            print(f"WebSocket endpoint available at ws://{host}:{port}/ws")
+            print()
+            await run_starlette(server, host=host, port=port)
+        else:
+            print("* Running MCP server in stdio mode. Press CTRL+C to exit.")
+            await run_server_stdio(server)
+
+
+def _run_async(coro: Any) -> None:
+    """Run a coroutine to completion, using uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is optional and not available on Windows.
+        asyncio.run(coro)
     else:
-        print("* Running MCP server in stdio mode. Press CTRL+C to exit.")
-        await run_server_stdio(server)
+        uvloop.run(coro)
 
 
-def get_usage_examples() -> str:
-    """Return usage examples for the command line interface."""
-    examples = """
+_USAGE_EXAMPLES = """
 Examples:
   # Connect to a Universal Tool Server with default settings
   o2mcp --url http://localhost:8000
@@ -302,10 +424,13 @@ Examples:
   # Connect and limit to specific tools
   o2mcp --url http://localhost:8000 --tools tool1 tool2 tool3
 
+  # Cache results of deterministic tools for 30 seconds
+  o2mcp --url http://localhost:8000 --cache-tools add echo --cache-ttl 30
+
   # List available tools without starting the server
   o2mcp --url http://localhost:8000 --list-tools
 
-  # Start the server in SSE mode
+  # Start the server in SSE mode (also serves a WebSocket endpoint at /ws)
   o2mcp --url http://localhost:8000 --mode sse
 
   # Start the server in SSE mode with custom host and port
@@ -314,12 +439,17 @@ Examples:
   # Display version information
   o2mcp --version
 """
-    return examples
+_USAGE_BYTES = f"{_USAGE_EXAMPLES}\n".encode()
+
+
+def get_usage_examples() -> str:
+    """Return usage examples for the command line interface."""
+    return _USAGE_EXAMPLES
 
 
 def show_usage_examples() -> None:
     """Print usage examples for the command line interface."""
-    print(get_usage_examples())
+    _write_bytes(_USAGE_BYTES)
 
 
 def main() -> None:
@@ -347,6 +477,21 @@ def main() -> None:
             "used"
         ),
     )
+    parser.add_argument(
+        "--cache-tools",
+        type=str,
+        nargs="*",
+        help=(
+            "List of deterministic tools whose results may be cached and reused "
+            "for identical arguments"
+        ),
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=60.0,
+        help="Number of seconds a cached tool result remains valid (default: 60)",
+    )
     parser.add_argument(
         "--list-tools", action="store_true", help="List available tools and exit"
     )
@@ -403,7 +548,7 @@ def main() -> None:
             sys.exit(1)
 
     if args.list_tools:
-        asyncio.run(display_tools_table(url=args.url, headers=headers))
+        _run_async(display_tools_table(url=args.url, headers=headers))
     else:
         sse_settings = None
 
@@ -417,13 +562,15 @@ def main() -> None:
                 "host": args.host,
                 "port": args.port,
             }
-        asyncio.run(
+        _run_async(
             run(
                 url=args.url,
                 headers=headers,
                 tools=args.tools,
                 mode=args.mode,
                 sse_settings=sse_settings,
+                cache_tools=args.cache_tools,
+                cache_ttl=args.cache_ttl,
             )
         )
 
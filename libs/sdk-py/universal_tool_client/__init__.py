@@ -3,7 +3,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+import time
+import weakref
 from importlib import metadata
+from operator import methodcaller
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -32,69 +35,213 @@ logger = logging.getLogger(__name__)
 
 PROTOCOL = "urn:oxp:1.0"
 
+try:
+    import h2  # noqa: F401
+except ImportError:
+    # HTTP/2 support is optional (`pip install universal-tool-client[http2]`).
+    _HTTP2 = False
+else:
+    _HTTP2 = True
+
+# Connection pool limits for the default transports.
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+_DEFAULT_UA_HEADERS = {"User-Agent": f"universal-tool-sdk-py/{__version__}"}
+
+
 def _get_headers(custom_headers: Optional[dict[str, str]]) -> dict[str, str]:
-    """Combine api_key and custom user-provided headers."""
-    custom_headers = custom_headers or {}
-    headers = {
-        "User-Agent": f"universal-tool-sdk-py/{__version__}",
-        **custom_headers,
-    }
-    return headers
+    """Combine api_key and custom user-provided headers.
+
+    Without custom headers the shared defaults are returned as is, so callers
+    must not mutate the result.
+    """
+    if not custom_headers:
+        return _DEFAULT_UA_HEADERS
+    return {**_DEFAULT_UA_HEADERS, **custom_headers}
+
+
+if sys.version_info >= (3, 11):
+
+    def _attach_body(e: httpx.HTTPStatusError, body: str) -> None:
+        e.add_note(body)
+
+else:
+
+    def _attach_body(e: httpx.HTTPStatusError, body: str) -> None:
+        # Exception notes are not available before Python 3.11.
+        logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
+
+
+def _check(r: httpx.Response) -> None:
+    """Raise for error status codes, attaching the response body to the error."""
+    try:
+        r.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        _attach_body(e, r.content.decode())
+        raise e
+
+
+# Status codes after which cached tool lists may be stale.
+_INVALIDATING_STATUS_CODES = frozenset({401, 403, 404})
+
+
+def _list_cache_key(headers: Optional[dict[str, str]]) -> Optional[frozenset]:
+    """Key cached tool lists by the per-request headers (e.g., credentials)."""
+    return frozenset(headers.items()) if headers else None
 
 
-def _decode_json(r: httpx.Response) -> Any:
-    body = r.read()
-    return orjson.loads(body if body else None)
+class _ListCache:
+    """Tool lists per set of per-request headers, each expiring after a TTL."""
 
+    def __init__(self, *, maxsize: int = 128) -> None:
+        self._maxsize = maxsize
+        self._data: dict[Optional[frozenset], tuple[float, list]] = {}
 
-def _encode_json(json: Any) -> tuple[dict[str, str], bytes]:
-    body = orjson.dumps(
+    def get(self, key: Optional[frozenset]) -> Optional[list]:
+        """Return a copy of the cached list, or None if missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, tools = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return list(tools)
+
+    def set(self, key: Optional[frozenset], tools: list, ttl: float) -> None:
+        """Store a list, evicting expired entries and the oldest if still full."""
+        now = time.monotonic()
+        self._data.pop(key, None)
+        if len(self._data) >= self._maxsize:
+            for old_key in [k for k, (exp, _) in self._data.items() if exp < now]:
+                del self._data[old_key]
+            if len(self._data) >= self._maxsize:
+                # Dicts preserve insertion order, so the first key is the oldest.
+                del self._data[next(iter(self._data))]
+        self._data[key] = (now + ttl, list(tools))
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+def _decode_json(body: bytes | bytearray) -> Any:
+    return orjson.loads(body) if body else None
+
+
+# Shared by every JSON request; httpx derives Content-Length from the body.
+# Must not be mutated.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_json(json: Any) -> bytes:
+    # Also called directly by the async client: request payloads are small and
+    # orjson encodes them faster than an executor round-trip would take.
+    return orjson.dumps(
         json,
         _orjson_default,
         orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
     )
-    content_length = str(len(body))
-    content_type = "application/json"
-    headers = {"Content-Length": content_length, "Content-Type": content_type}
-    return headers, body
+
+
+# Serializer for each type seen by `_orjson_default`, so capabilities are probed
+# once per type rather than once per object. Types are held weakly, so classes
+# created at runtime (e.g., dynamic pydantic models) can still be collected.
+_SERIALIZER_CACHE: weakref.WeakKeyDictionary[type, Callable[[Any], Any]] = (
+    weakref.WeakKeyDictionary({set: list, frozenset: list})
+)
 
 
 def _orjson_default(obj: Any) -> Any:
-    if hasattr(obj, "model_dump") and callable(obj.model_dump):
-        return obj.model_dump()
-    elif hasattr(obj, "dict") and callable(obj.dict):
-        return obj.dict()
-    elif isinstance(obj, (set, frozenset)):
-        return list(obj)
-    else:
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-
-async def _aencode_json(json: Any) -> tuple[dict[str, str], bytes]:
-    """Encode JSON."""
-    if json is None:
-        return {}, None
-    body = await asyncio.get_running_loop().run_in_executor(
-        None,
-        orjson.dumps,
-        json,
-        _orjson_default,
-        orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
-    )
-    content_length = str(len(body))
-    content_type = "application/json"
-    headers = {"Content-Length": content_length, "Content-Type": content_type}
-    return headers, body
-
-
-async def _adecode_json(r: httpx.Response) -> Any:
-    """Decode JSON."""
-    body = await r.aread()
-    return (
-        await asyncio.get_running_loop().run_in_executor(None, orjson.loads, body)
-        if body
-        else None
-    )
+    type_ = type(obj)
+    serializer = _SERIALIZER_CACHE.get(type_)
+    if serializer is None:
+        if hasattr(obj, "model_dump") and callable(obj.model_dump):
+            serializer = methodcaller("model_dump")
+        elif hasattr(obj, "dict") and callable(obj.dict):
+            serializer = methodcaller("dict")
+        elif isinstance(obj, (set, frozenset)):
+            serializer = list
+        else:
+            raise TypeError(f"Object of type {type_} is not JSON serializable")
+        _SERIALIZER_CACHE[type_] = serializer
+    return serializer(obj)
+
+
+# Responses larger than this (in bytes) are decoded off the event loop.
+_INLINE_JSON_MAX = 64 * 1024
+
+
+# Chunk size used when streaming large response bodies.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _preallocate(r: httpx.Response) -> Optional[bytearray]:
+    """Allocate a buffer for a large body whose exact size is known up front.
+
+    Returns None for small bodies, and for bodies without a Content-Length or
+    with a Content-Encoding (the decoded size is unknown until decoded).
+    """
+    if "content-encoding" in r.headers:
+        return None
+    length = r.headers.get("content-length", "")
+    if not length.isdigit() or int(length) <= _INLINE_JSON_MAX:
+        return None
+    return bytearray(int(length))
+
+
+def _read(r: httpx.Response) -> bytes | bytearray:
+    """Read a streamed response body, raising for error status codes.
+
+    Large bodies are copied into a single preallocated buffer, instead of being
+    collected as chunks and then joined, which would hold the body twice.
+    """
+    if not r.is_success:
+        r.read()
+        _check(r)
+    buffer = _preallocate(r)
+    if buffer is None:
+        return r.read()
+    view = memoryview(buffer)
+    pos = 0
+    for chunk in r.iter_raw(_STREAM_CHUNK_SIZE):
+        view[pos : pos + len(chunk)] = chunk
+        pos += len(chunk)
+    view.release()
+    return buffer if pos == len(buffer) else buffer[:pos]
+
+
+async def _aread(r: httpx.Response) -> bytes | bytearray:
+    """Read a streamed response body, raising for error status codes.
+
+    Large bodies are copied into a single preallocated buffer, instead of being
+    collected as chunks and then joined, which would hold the body twice.
+    """
+    if not r.is_success:
+        await r.aread()
+        _check(r)
+    buffer = _preallocate(r)
+    if buffer is None:
+        return await r.aread()
+    view = memoryview(buffer)
+    pos = 0
+    async for chunk in r.aiter_raw(_STREAM_CHUNK_SIZE):
+        view[pos : pos + len(chunk)] = chunk
+        pos += len(chunk)
+    view.release()
+    return buffer if pos == len(buffer) else buffer[:pos]
+
+
+async def _adecode_json(body: bytes | bytearray) -> Any:
+    """Decode JSON, using the default executor only for large bodies.
+
+    The event loop is only looked up on that slow path.
+    """
+    if not body:
+        return None
+    if len(body) <= _INLINE_JSON_MAX:
+        return orjson.loads(body)
+    return await asyncio.get_running_loop().run_in_executor(None, orjson.loads, body)
 
 
 class AsyncHttpClient:
@@ -110,160 +257,112 @@ class AsyncHttpClient:
     def __init__(self, client: httpx.AsyncClient) -> None:
         self.client = client
 
-    async def get(self, path: str, *, params: Optional[QueryParamTypes] = None) -> Any:
+    async def get(
+        self,
+        path: str,
+        *,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> Any:
         """Send a GET request."""
-        r = await self.client.get(path, params=params)
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body = (await r.aread()).decode()
-            if sys.version_info >= (3, 11):
-                e.add_note(body)
-            else:
-                logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
-            raise e
-        return await _adecode_json(r)
-
-    async def post(self, path: str, *, json: Optional[dict]) -> Any:
+        r = await self.client.get(path, params=params, headers=headers)
+        _check(r)
+        return await _adecode_json(r.content)
+
+    async def post(
+        self,
+        path: str,
+        *,
+        json: Optional[dict],
+        headers: Optional[dict[str, str]] = None,
+    ) -> Any:
         """Send a POST request."""
         if json is not None:
-            headers, content = await _aencode_json(json)
+            content = _encode_json(json)
+            request_headers = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
         else:
-            headers, content = {}, b""
-        r = await self.client.post(path, headers=headers, content=content)
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body = (await r.aread()).decode()
-            if sys.version_info >= (3, 11):
-                e.add_note(body)
-            else:
-                logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
-            raise e
-        return await _adecode_json(r)
+            content = b""
+            request_headers = headers
+        async with self.client.stream(
+            "POST", path, headers=request_headers, content=content
+        ) as r:
+            body = await _aread(r)
+        return await _adecode_json(body)
 
     async def put(self, path: str, *, json: dict) -> Any:
         """Send a PUT request."""
-        headers, content = await _aencode_json(json)
-        r = await self.client.put(path, headers=headers, content=content)
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body = (await r.aread()).decode()
-            if sys.version_info >= (3, 11):
-                e.add_note(body)
-            else:
-                logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
-            raise e
-        return await _adecode_json(r)
+        content = _encode_json(json)
+        r = await self.client.put(path, headers=_JSON_HEADERS, content=content)
+        _check(r)
+        return await _adecode_json(r.content)
 
     async def patch(self, path: str, *, json: dict) -> Any:
         """Send a PATCH request."""
-        headers, content = await _aencode_json(json)
-        r = await self.client.patch(path, headers=headers, content=content)
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body = (await r.aread()).decode()
-            if sys.version_info >= (3, 11):
-                e.add_note(body)
-            else:
-                logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
-            raise e
-        return await _adecode_json(r)
+        content = _encode_json(json)
+        r = await self.client.patch(path, headers=_JSON_HEADERS, content=content)
+        _check(r)
+        return await _adecode_json(r.content)
 
     async def delete(self, path: str, *, json: Optional[Any] = None) -> None:
         """Send a DELETE request."""
         r = await self.client.request("DELETE", path, json=json)
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body = (await r.aread()).decode()
-            if sys.version_info >= (3, 11):
-                e.add_note(body)
-            else:
-                logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
-            raise e
+        _check(r)
 
 
 class SyncHttpClient:
     def __init__(self, client: httpx.Client) -> None:
         self.client = client
 
-    def get(self, path: str, *, params: Optional[QueryParamTypes] = None) -> Any:
+    def get(
+        self,
+        path: str,
+        *,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> Any:
         """Send a GET request."""
-        r = self.client.get(path, params=params)
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body = r.read().decode()
-            if sys.version_info >= (3, 11):
-                e.add_note(body)
-            else:
-                logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
-            raise e
-        return _decode_json(r)
-
-    def post(self, path: str, *, json: Optional[dict]) -> Any:
+        r = self.client.get(path, params=params, headers=headers)
+        _check(r)
+        return _decode_json(r.content)
+
+    def post(
+        self,
+        path: str,
+        *,
+        json: Optional[dict],
+        headers: Optional[dict[str, str]] = None,
+    ) -> Any:
         """Send a POST request."""
         if json is not None:
-            headers, content = _encode_json(json)
+            content = _encode_json(json)
+            request_headers = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
         else:
-            headers, content = {}, b""
-        r = self.client.post(path, headers=headers, content=content)
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body = r.read().decode()
-            if sys.version_info >= (3, 11):
-                e.add_note(body)
-            else:
-                logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
-            raise e
-        return _decode_json(r)
+            content = b""
+            request_headers = headers
+        with self.client.stream(
+            "POST", path, headers=request_headers, content=content
+        ) as r:
+            body = _read(r)
+        return _decode_json(body)
 
     def put(self, path: str, *, json: dict) -> Any:
         """Send a PUT request."""
-        headers, content = _encode_json(json)
-        r = self.client.put(path, headers=headers, content=content)
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body = r.read().decode()
-            if sys.version_info >= (3, 11):
-                e.add_note(body)
-            else:
-                logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
-            raise e
-        return _decode_json(r)
+        content = _encode_json(json)
+        r = self.client.put(path, headers=_JSON_HEADERS, content=content)
+        _check(r)
+        return _decode_json(r.content)
 
     def patch(self, path: str, *, json: dict) -> Any:
         """Send a PATCH request."""
-        headers, content = _encode_json(json)
-        r = self.client.patch(path, headers=headers, content=content)
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body = r.read().decode()
-            if sys.version_info >= (3, 11):
-                e.add_note(body)
-            else:
-                logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
-            raise e
-        return _decode_json(r)
+        content = _encode_json(json)
+        r = self.client.patch(path, headers=_JSON_HEADERS, content=content)
+        _check(r)
+        return _decode_json(r.content)
 
     def delete(self, path: str, *, json: Optional[Any] = None) -> None:
         """Send a DELETE request."""
         r = self.client.request("DELETE", path, json=json)
-        try:
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body = r.read().decode()
-            if sys.version_info >= (3, 11):
-                e.add_note(body)
-            else:
-                logger.error(f"Error from universal-tool-server: {body}", exc_info=e)
-            raise e
+        _check(r)
 
 
 ############
@@ -275,13 +374,18 @@ def get_async_client(
     url: Optional[str] = None,
     headers: Optional[dict[str, str]] = None,
     transport: Optional[httpx.AsyncBaseTransport] = None,
+    tools_list_ttl: float = 0,
 ) -> AsyncClient:
     """Get instance.
 
     Args:
         url: The URL of the tool server.
         headers: Optional custom headers
-        transport: Optional transport to use.
+        transport: Optional transport to use. The default transport retries
+            failed connections, pools up to 100 connections, and negotiates
+            HTTP/2 when `h2` is installed. A custom transport opts out of these.
+        tools_list_ttl: Seconds for which the result of `tools.list` is reused.
+            Disabled by default.
 
     Returns:
         AsyncClient: The top-level client for accessing the tool server.
@@ -291,7 +395,7 @@ def get_async_client(
         url = "http://localhost:2424"
 
     if transport is None:
-        transport = httpx.AsyncHTTPTransport(retries=5)
+        transport = httpx.AsyncHTTPTransport(retries=5, http2=_HTTP2, limits=_LIMITS)
 
     client = httpx.AsyncClient(
         base_url=url,
@@ -299,7 +403,7 @@ def get_async_client(
         timeout=httpx.Timeout(connect=5, read=300, write=300, pool=5),
         headers=_get_headers(headers),
     )
-    return AsyncClient(client)
+    return AsyncClient(client, tools_list_ttl=tools_list_ttl)
 
 
 def get_sync_client(
@@ -307,13 +411,18 @@ def get_sync_client(
     url: Optional[str] = None,
     headers: Optional[dict[str, str]] = None,
     transport: Optional[httpx.AsyncBaseTransport] = None,
+    tools_list_ttl: float = 0,
 ) -> SyncClient:
     """Get instance.
 
     Args:
         url: The URL of the tool server.
         headers: Optional custom headers
-        transport: Optional transport to use.
+        transport: Optional transport to use. The default transport retries
+            failed connections, pools up to 100 connections, and negotiates
+            HTTP/2 when `h2` is installed. A custom transport opts out of these.
+        tools_list_ttl: Seconds for which the result of `tools.list` is reused.
+            Disabled by default.
 
     Returns:
         AsyncClient: The top-level client for accessing the tool server.
@@ -323,7 +432,7 @@ def get_sync_client(
         url = "http://localhost:2424"
 
     if transport is None:
-        transport = httpx.HTTPTransport(retries=5)
+        transport = httpx.HTTPTransport(retries=5, http2=_HTTP2, limits=_LIMITS)
 
     client = httpx.Client(
         base_url=url,
@@ -331,16 +440,26 @@ def get_sync_client(
         timeout=httpx.Timeout(connect=5, read=300, write=300, pool=5),
         headers=_get_headers(headers),
     )
-    return SyncClient(client)
+    return SyncClient(client, tools_list_ttl=tools_list_ttl)
 
 
 class AsyncClient:
     """Top-level client for the tools server."""
 
-    def __init__(self, client: httpx.AsyncClient) -> None:
+    def __init__(self, client: httpx.AsyncClient, *, tools_list_ttl: float = 0) -> None:
         """Initialize the client."""
         self.http = AsyncHttpClient(client)
-        self.tools = AsyncToolsClient(self.http)
+        self.tools = AsyncToolsClient(self.http, list_ttl=tools_list_ttl)
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release its connections."""
+        await self.http.client.aclose()
 
     async def info(self) -> Any:
         return await self.http.get("/info")
@@ -352,10 +471,20 @@ class AsyncClient:
 class SyncClient:
     """Top-level client for the tools server."""
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, *, tools_list_ttl: float = 0) -> None:
         """Initialize the client."""
         self.http = SyncHttpClient(client)
-        self.tools = SyncToolsClient(self.http)
+        self.tools = SyncToolsClient(self.http, list_ttl=tools_list_ttl)
+
+    def __enter__(self) -> SyncClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and release its connections."""
+        self.http.client.close()
 
     def info(self) -> Any:
         return self.http.get("/info")
@@ -367,13 +496,40 @@ class SyncClient:
 class AsyncToolsClient:
     """Tools API."""
 
-    def __init__(self, http: AsyncHttpClient) -> None:
-        """Initialize the client."""
+    def __init__(self, http: AsyncHttpClient, *, list_ttl: float = 0) -> None:
+        """Initialize the client.
+
+        Args:
+            http: HTTP client used to talk to the server.
+            list_ttl: Seconds for which the result of `list` is reused for the
+                same per-request headers. Disabled when 0.
+        """
         self.http = http
+        self.list_ttl = list_ttl
+        self._list_cache = _ListCache()
+
+    def invalidate_cache(self) -> None:
+        """Forget every cached tool list."""
+        self._list_cache.clear()
+
+    async def list(self, *, headers: Optional[dict[str, str]] = None) -> Any:
+        """List tools.
 
-    async def list(self) -> Any:
-        """List tools."""
-        return await self.http.get("/tools")
+        When caching is enabled, each call gets its own list, but the tool
+        definitions in it are shared between calls and must not be mutated.
+
+        Args:
+            headers: Optional headers to send with this request only.
+        """
+        if not self.list_ttl:
+            return await self.http.get("/tools", headers=headers)
+
+        key = _list_cache_key(headers)
+        tools = self._list_cache.get(key)
+        if tools is None:
+            tools = await self.http.get("/tools", headers=headers)
+            self._list_cache.set(key, tools, self.list_ttl)
+        return tools
 
     async def call(
         self,
@@ -381,15 +537,59 @@ class AsyncToolsClient:
         args: Dict[str, Any] | None = None,
         *,
         call_id: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
     ) -> Any:
-        """Call a tool."""
+        """Call a tool.
+
+        Args:
+            tool_id: Name of the tool, optionally with a version (`name@version`).
+            args: Arguments to pass to the tool.
+            call_id: Optional ID for the execution.
+            headers: Optional headers to send with this request only.
+        """
         payload = {"tool_id": tool_id}
         if args is not None:
             payload["input"] = args
         if call_id is not None:
             payload["call_id"] = call_id
         request = {"request": payload, "$schema": PROTOCOL}
-        return await self.http.post("/tools/call", json=request)
+        try:
+            return await self.http.post("/tools/call", json=request, headers=headers)
+        except httpx.HTTPStatusError as e:
+            # The tool may have been removed or its permissions changed.
+            if e.response.status_code in _INVALIDATING_STATUS_CODES:
+                self.invalidate_cache()
+            raise
+
+    async def batch_call(
+        self,
+        calls: Sequence[Dict[str, Any]],
+        *,
+        headers: Optional[dict[str, str]] = None,
+    ) -> List[Any]:
+        """Call several tools in a single request.
+
+        The server runs the calls concurrently. If any of them fails, the whole
+        batch fails.
+
+        Args:
+            calls: Requests to call a tool, each with a `tool_id` and optionally
+                an `input` and a `call_id`.
+            headers: Optional headers to send with this request only.
+
+        Returns:
+            The results of the calls, in the same order as `calls`.
+        """
+        request = {"requests": list(calls), "$schema": PROTOCOL}
+        try:
+            return await self.http.post(
+                "/tools/call/batch", json=request, headers=headers
+            )
+        except httpx.HTTPStatusError as e:
+            # The tool may have been removed or its permissions changed.
+            if e.response.status_code in _INVALIDATING_STATUS_CODES:
+                self.invalidate_cache()
+            raise
 
     async def as_langchain_tools(
         self, *, tool_ids: Sequence[str] | None = None
@@ -417,11 +617,14 @@ class AsyncToolsClient:
 
         if tool_ids is None:
             tool_ids = list(available_tools_by_name)
-
-        if set(tool_ids) - set(available_tools_by_name):
-            raise ValueError(
-                f"Unknown tool names: {set(tool_ids) - set(available_tools_by_name)}"
-            )
+        else:
+            missing = [
+                tool_id
+                for tool_id in tool_ids
+                if tool_id not in available_tools_by_name
+            ]
+            if missing:
+                raise ValueError(f"Unknown tool names: {missing}")
 
         # The code below will create LangChain style tools by binding
         # tool metadata and the tool implementation together in a StructuredTool.
@@ -459,13 +662,40 @@ class AsyncToolsClient:
 class SyncToolsClient:
     """Tools API."""
 
-    def __init__(self, http: SyncHttpClient) -> None:
-        """Initialize the client."""
+    def __init__(self, http: SyncHttpClient, *, list_ttl: float = 0) -> None:
+        """Initialize the client.
+
+        Args:
+            http: HTTP client used to talk to the server.
+            list_ttl: Seconds for which the result of `list` is reused for the
+                same per-request headers. Disabled when 0.
+        """
         self.http = http
+        self.list_ttl = list_ttl
+        self._list_cache = _ListCache()
+
+    def invalidate_cache(self) -> None:
+        """Forget every cached tool list."""
+        self._list_cache.clear()
 
-    def list(self) -> Any:
-        """List tools."""
-        return self.http.get("/tools")
+    def list(self, *, headers: Optional[dict[str, str]] = None) -> Any:
+        """List tools.
+
+        When caching is enabled, each call gets its own list, but the tool
+        definitions in it are shared between calls and must not be mutated.
+
+        Args:
+            headers: Optional headers to send with this request only.
+        """
+        if not self.list_ttl:
+            return self.http.get("/tools", headers=headers)
+
+        key = _list_cache_key(headers)
+        tools = self._list_cache.get(key)
+        if tools is None:
+            tools = self.http.get("/tools", headers=headers)
+            self._list_cache.set(key, tools, self.list_ttl)
+        return tools
 
     def call(
         self,
@@ -473,8 +703,16 @@ class SyncToolsClient:
         args: Dict[str, Any] | None = None,
         *,
         call_id: str | None = None,
+        headers: Optional[dict[str, str]] = None,
     ) -> Any:
-        """Call a tool."""
+        """Call a tool.
+
+        Args:
+            tool_id: Name of the tool, optionally with a version (`name@version`).
+            args: Arguments to pass to the tool.
+            call_id: Optional ID for the execution.
+            headers: Optional headers to send with this request only.
+        """
 
         payload = {"tool_id": tool_id}
         if args is not None:
@@ -485,7 +723,41 @@ class SyncToolsClient:
             "$schema": PROTOCOL,
             "request": payload,
         }
-        return self.http.post("/tools/call", json=request)
+        try:
+            return self.http.post("/tools/call", json=request, headers=headers)
+        except httpx.HTTPStatusError as e:
+            # The tool may have been removed or its permissions changed.
+            if e.response.status_code in _INVALIDATING_STATUS_CODES:
+                self.invalidate_cache()
+            raise
+
+    def batch_call(
+        self,
+        calls: Sequence[Dict[str, Any]],
+        *,
+        headers: Optional[dict[str, str]] = None,
+    ) -> List[Any]:
+        """Call several tools in a single request.
+
+        The server runs the calls concurrently. If any of them fails, the whole
+        batch fails.
+
+        Args:
+            calls: Requests to call a tool, each with a `tool_id` and optionally
+                an `input` and a `call_id`.
+            headers: Optional headers to send with this request only.
+
+        Returns:
+            The results of the calls, in the same order as `calls`.
+        """
+        request = {"$schema": PROTOCOL, "requests": list(calls)}
+        try:
+            return self.http.post("/tools/call/batch", json=request, headers=headers)
+        except httpx.HTTPStatusError as e:
+            # The tool may have been removed or its permissions changed.
+            if e.response.status_code in _INVALIDATING_STATUS_CODES:
+                self.invalidate_cache()
+            raise
 
     def as_langchain_tools(
         self, *, tool_ids: Sequence[str] | None = None
@@ -512,11 +784,14 @@ class SyncToolsClient:
 
         if tool_ids is None:
             tool_ids = list(available_tools_by_name)
-
-        if set(tool_ids) - set(available_tools_by_name):
-            raise ValueError(
-                f"Unknown tool names: {set(tool_ids) - set(available_tools_by_name)}"
-            )
+        else:
+            missing = [
+                tool_id
+                for tool_id in tool_ids
+                if tool_id not in available_tools_by_name
+            ]
+            if missing:
+                raise ValueError(f"Unknown tool names: {missing}")
 
         # The code below will create LangChain style tools by binding
         # tool metadata and the tool implementation together in a StructuredTool.
@@ -5,20 +5,21 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from mcp import ClientSession
-from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
 
 
 @asynccontextmanager
 async def get_client(
     url: str, *, headers: dict | None = None
 ) -> AsyncGenerator[ClientSession, None]:
-    async with sse_client(url=url, headers=headers) as streams:
-        async with ClientSession(streams[0], streams[1]) as session:
+    # Streamable HTTP sends each request as a plain POST, with no SSE handshake.
+    async with streamablehttp_client(url, headers=headers) as (read, write, _):
+        async with ClientSession(read, write) as session:
             await session.initialize()
             yield session
 
 
-URL = os.environ.get("MCP_SSE_URL", "http://localhost:8131/mcp/sse")
+URL = os.environ.get("MCP_URL", "http://localhost:8131/mcp")
 
 
 async def test_list_tools() -> None:
@@ -0,0 +1,136 @@
+import copy
+
+import pytest
+from starlette.requests import HTTPConnection, Request
+
+from universal_tool_server.auth import Auth
+from universal_tool_server.auth.middleware import (
+    DotDict,
+    ProxyUser,
+    ServerAuthenticationBackend,
+)
+
+
+def _make_connection(headers: list[tuple[bytes, bytes]]) -> HTTPConnection:
+    return HTTPConnection(
+        {"type": "http", "method": "GET", "path": "/tools", "headers": headers}
+    )
+
+
+async def test_sync_handler_receives_its_arguments() -> None:
+    """Test that sync handlers are inspected, not the thread pool wrapper."""
+    auth = Auth()
+
+    @auth.authenticate
+    def authenticate(authorization: str | None, method: str) -> dict:
+        return {"identity": f"{method} {authorization}", "permissions": ["read"]}
+
+    backend = ServerAuthenticationBackend(auth)
+    assert backend.param_names == {"authorization", "method"}
+
+    credentials, user = await backend.authenticate(
+        _make_connection([(b"authorization", b"Bearer token")])
+    )
+    assert credentials.scopes == ["read"]
+    assert user.identity == "GET Bearer token"
+
+
+def test_extract_only_requested_arguments() -> None:
+    """Test that the extractor only reads the arguments the handler takes."""
+    auth = Auth()
+
+    @auth.authenticate
+    async def authenticate(path: str, headers: dict, scopes: list[str]) -> str:
+        return "user"
+
+    backend = ServerAuthenticationBackend(auth)
+    connection = _make_connection([(b"x-api-key", b"1")])
+    assert backend.extract_arguments(connection.scope) == {
+        "path": "/tools",
+        "headers": {b"x-api-key": b"1"},
+        "scopes": [],
+    }
+
+
+def test_extract_authorization() -> None:
+    """Test reading the authorization header from the raw ASGI headers."""
+    auth = Auth()
+
+    @auth.authenticate
+    async def authenticate(authorization: str | None) -> str:
+        return "user"
+
+    backend = ServerAuthenticationBackend(auth)
+    headers = [(b"x-api-key", b"1"), (b"authorization", b"Bearer token")]
+    connection = _make_connection(headers)
+    assert backend.extract_arguments(connection.scope) == {
+        "authorization": "Bearer token"
+    }
+    connection = _make_connection(headers[:1])
+    assert backend.extract_arguments(connection.scope) == {"authorization": None}
+    # An empty header counts as missing.
+    connection = _make_connection([(b"authorization", b"")])
+    assert backend.extract_arguments(connection.scope) == {"authorization": None}
+    # The last of repeated headers wins, as with the `headers` argument.
+    connection = _make_connection([(b"authorization", b"A"), (b"authorization", b"B")])
+    assert backend.extract_arguments(connection.scope) == {"authorization": "B"}
+
+
+def test_lazy_headers() -> None:
+    """Test that the headers behave like a dict of the raw headers."""
+    auth = Auth()
+
+    @auth.authenticate
+    async def authenticate(headers: dict) -> str:
+        return "user"
+
+    backend = ServerAuthenticationBackend(auth)
+    raw = [(b"x-api-key", b"1"), (b"accept", b"*/*"), (b"x-api-key", b"2")]
+    headers = backend.extract_arguments(_make_connection(raw).scope)["headers"]
+    assert headers[b"x-api-key"] == b"2"
+    assert headers.get(b"missing") is None
+    assert b"accept" in headers
+    assert headers == dict(raw)
+
+    # It is still a dict that handlers may copy or modify.
+    headers = backend.extract_arguments(_make_connection(raw).scope)["headers"]
+    assert isinstance(headers, dict)
+    assert headers.copy() == dict(raw)
+    headers[b"x-api-key"] = b"3"
+    assert headers == {b"x-api-key": b"3", b"accept": b"*/*"}
+    assert copy.copy(headers) == headers
+
+
+def test_dot_dict() -> None:
+    """Test attribute access on nested dicts."""
+    user = DotDict({"identity": "user", "org": {"name": "acme"}})
+    assert user.identity == "user"
+    assert user.org.name == "acme"
+    assert user.org is user.org
+    assert user["org"] == {"name": "acme"}
+
+    user["org"] = {"name": "other"}
+    assert user.org.name == "other"
+    with pytest.raises(AttributeError):
+        _ = user.missing
+
+
+def test_copy_user() -> None:
+    """Test that users can be copied without recursing into `__getattr__`."""
+    user = ProxyUser(DotDict({"identity": "user", "org": {"name": "acme"}}))
+    assert copy.copy(user).org.name == "acme"
+    assert copy.deepcopy(user).org.name == "acme"
+
+
+def test_extract_request() -> None:
+    """Test that a Request is built for handlers that take one."""
+    auth = Auth()
+
+    @auth.authenticate
+    async def authenticate(request: Request) -> str:
+        return "user"
+
+    backend = ServerAuthenticationBackend(auth)
+    args = backend.extract_arguments(_make_connection([]).scope)
+    assert isinstance(args["request"], Request)
+    assert args["request"].url.path == "/tools"
@@ -1,59 +1,92 @@
 from typing import Any
 
-from langchain_core.tools import tool
+import pytest
+from langchain_core.tools import StructuredTool, tool
 from typing_extensions import TypedDict
 
-from universal_tool_server.tools import get_output_schema
+from universal_tool_server.tools import ToolHandler, get_output_schema
 
+# Marks a function without a return annotation.
+_MISSING = object()
 
-async def test_get_output_schema() -> None:
-    """Test get output schema."""
 
-    @tool
-    def another_tool() -> str:
-        """Hello"""
+class Foo(TypedDict):
+    bar: str
 
-    assert get_output_schema(another_tool) == {"type": "string"}
 
-    @tool
-    async def async_another_tool() -> str:
+def _make_tool(annotation: Any) -> StructuredTool:
+    """Build a tool around a fresh function with the given return annotation.
+
+    Skips the tool decorator, which is not what is under test.
+    """
+
+    def fn():
         """Hello"""
 
-    assert get_output_schema(async_another_tool) == {"type": "string"}
+    if annotation is not _MISSING:
+        fn.__annotations__["return"] = annotation
+    return StructuredTool.model_construct(func=fn, coroutine=None)
+
+
+@pytest.mark.parametrize(
+    "annotation, expected",
+    [
+        (str, {"type": "string"}),
+        (
+            Foo,
+            {
+                "properties": {"bar": {"title": "Bar", "type": "string"}},
+                "required": ["bar"],
+                "title": "Foo",
+                "type": "object",
+            },
+        ),
+        (None, {"type": "null"}),
+        (Any, {}),
+        # Unspecified return type (same as Any)
+        (_MISSING, {}),
+    ],
+    ids=["str", "typed_dict", "none", "any", "unspecified"],
+)
+def test_get_output_schema(annotation: Any, expected: dict) -> None:
+    """Test get output schema."""
+    assert get_output_schema(_make_tool(annotation)) == expected
 
-    class Foo(TypedDict):
-        bar: str
+
+async def test_get_output_schema_from_decorated_tools() -> None:
+    """Test get output schema of sync and async tools built with the decorator."""
 
     @tool
-    def call_tool() -> Foo:
+    def another_tool() -> str:
         """Hello"""
-        pass
 
-    assert get_output_schema(call_tool) == {
-        "properties": {"bar": {"title": "Bar", "type": "string"}},
-        "required": ["bar"],
-        "title": "Foo",
-        "type": "object",
-    }
+    assert get_output_schema(another_tool) == {"type": "string"}
 
     @tool
-    def void_tool() -> None:
+    async def async_another_tool() -> str:
         """Hello"""
-        pass
 
-    assert get_output_schema(void_tool) == {"type": "null"}
+    assert get_output_schema(async_another_tool) == {"type": "string"}
+    # Schemas are cached per function.
+    assert get_output_schema(async_another_tool) is get_output_schema(
+        async_another_tool
+    )
+
 
-    @tool
-    def any_tool() -> Any:
-        """Hello"""
-        pass
+def test_schemas_are_shared_between_registrations() -> None:
+    """Test that a function is only compiled once, whatever its version."""
 
-    assert get_output_schema(any_tool) == {}
+    def add(x: int, y: int) -> int:
+        """Add two integers."""
+        return x + y
 
-    # Unspecified return type (same as Any)
-    @tool
-    def unspecified_tool():
-        """Hello"""
-        pass
+    first, second = ToolHandler(), ToolHandler()
+    first.add(add)
+    second.add(add, version=2, permissions=["group1"])
 
-    assert get_output_schema(unspecified_tool) == {}
+    first_tool = first.catalog["add@1.0.0"]
+    second_tool = second.catalog["add@2.0.0"]
+    assert second_tool["input_schema"] is first_tool["input_schema"]
+    assert second_tool["validator"] is first_tool["validator"]
+    assert second_tool["permissions"] == {"group1"}
+    assert not first_tool["permissions"]
@@ -1,60 +1,107 @@
 """Test the server."""
 
-from contextlib import asynccontextmanager
-from typing import Annotated, AsyncGenerator, Optional, cast
+import asyncio
+from typing import Annotated, Any, AsyncGenerator, Optional
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
-from httpx import ASGITransport, HTTPStatusError
+from httpx import ASGITransport, HTTPStatusError, MockTransport, Response
+from langchain_core.tools import BaseTool, StructuredTool, tool
 from starlette.authentication import BaseUser
 from starlette.requests import Request
-from universal_tool_client import AsyncClient, get_async_client
+from universal_tool_client import AsyncClient, _ListCache, get_async_client
 
 from universal_tool_server import Server
 from universal_tool_server._version import __version__
-from universal_tool_server.auth import Auth
 from universal_tool_server.tools import InjectedRequest
 
-from ..unit_tests.utils import AnyStr
-
-
-@asynccontextmanager
-async def get_async_test_client(
-    server: FastAPI,
-    *,
-    path: Optional[str] = None,
-    raise_app_exceptions: bool = True,
-    headers: dict | None = None,
-) -> AsyncGenerator[AsyncClient, None]:
-    """Get an async client."""
-    url = "http://localhost:9999"
-    if path:
-        url += path
-    transport = ASGITransport(
-        app=server,
-        raise_app_exceptions=raise_app_exceptions,
-    )
-
-    client = get_async_client(transport=transport, headers=headers)
+from ..unit_tests.utils import (
+    ADD_SPEC,
+    API_KEY_TO_AUTHORIZED_USER,
+    API_KEY_TO_USER,
+    AUTH_HEADERS,
+    ECHO_SPEC,
+    MULTIPLY_SPEC,
+    SAY_HELLO_SPEC,
+    AnyStr,
+    make_auth,
+)
+
+# Run every test on the same event loop so clients can be shared between tests.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+class AsyncTestClient:
+    """Async context manager that opens a client for a server."""
+
+    def __init__(
+        self,
+        server: FastAPI,
+        *,
+        raise_app_exceptions: bool = True,
+        headers: dict | None = None,
+        tools_list_ttl: float = 0,
+    ) -> None:
+        self._transport = ASGITransport(
+            app=server,
+            raise_app_exceptions=raise_app_exceptions,
+        )
+        self._headers = headers
+        self._tools_list_ttl = tools_list_ttl
+        self._client: Optional[AsyncClient] = None
+
+    async def __aenter__(self) -> AsyncClient:
+        self._client = get_async_client(
+            transport=self._transport,
+            headers=self._headers,
+            tools_list_ttl=self._tools_list_ttl,
+        )
+        return self._client
 
-    try:
-        yield cast(AsyncClient, client)
-    finally:
-        del client
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._client.aclose()
+        self._client = None
 
 
-async def test_health() -> None:
+@pytest.fixture(scope="module")
+def tools_app() -> Server:
+    """Server with a few tools, shared by tests that do not modify it."""
     app = Server()
-    async with get_async_test_client(app) as client:
-        assert await client.health() == {"status": "OK"}
 
+    @app.add_tool
+    async def say_hello() -> str:
+        """Say hello."""
+        return "Hello"
+
+    @app.add_tool
+    async def echo(msg: str) -> str:
+        """Echo the message back."""
+        return msg
+
+    @app.add_tool
+    async def add(x: int, y: int) -> int:
+        """Add two integers."""
+        return x + y
+
+    return app
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def tools_client(tools_app: Server) -> AsyncGenerator[AsyncClient, None]:
+    """Client for `tools_app`, shared by the tests that use it."""
+    async with AsyncTestClient(tools_app) as client:
+        yield client
+
+
+async def test_health(tools_client: AsyncClient) -> None:
+    assert await tools_client.health() == {"status": "OK"}
 
-async def test_info() -> None:
-    app = Server()
-    async with get_async_test_client(app) as client:
-        assert await client.info() == {
-            "version": __version__,
-        }
+
+async def test_info(tools_client: AsyncClient) -> None:
+    assert await tools_client.info() == {
+        "version": __version__,
+    }
 
 
 async def test_add_langchain_tool() -> None:
@@ -62,65 +109,35 @@ async def test_add_langchain_tool() -> None:
     app = Server()
 
     # Test prior to adding any tools
-    async with get_async_test_client(app) as client:
+    async with AsyncTestClient(app) as client:
         tools = await client.tools.list()
         assert tools == []
 
-    @app.add_tool
     async def say_hello() -> str:
         """Say hello."""
         return "Hello"
 
-    @app.add_tool
     async def echo(msg: str) -> str:
         """Echo the message back."""
         return msg
 
-    @app.add_tool
     async def add(x: int, y: int) -> int:
         """Add two integers."""
         return x + y
 
-    async with get_async_test_client(app) as client:
+    app.add_tools([say_hello, echo, add])
+
+    async with AsyncTestClient(app) as client:
         data = await client.tools.list()
         assert data == [
-            {
-                "description": "Say hello.",
-                "id": "say_hello@1.0.0",
-                "input_schema": {"properties": {}, "type": "object"},
-                "name": "say_hello",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
-            },
-            {
-                "description": "Echo the message back.",
-                "id": "echo@1.0.0",
-                "input_schema": {
-                    "properties": {"msg": {"type": "string"}},
-                    "required": ["msg"],
-                    "type": "object",
-                },
-                "name": "echo",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
-            },
-            {
-                "description": "Add two integers.",
-                "id": "add@1.0.0",
-                "input_schema": {
-                    "properties": {"x": {"type": "integer"}, "y": {"type": "integer"}},
-                    "required": ["x", "y"],
-                    "type": "object",
-                },
-                "name": "add",
-                "output_schema": {"type": "integer"},
-                "version": "1.0.0",
-            },
+            SAY_HELLO_SPEC,
+            ECHO_SPEC,
+            ADD_SPEC,
         ]
 
 
-async def test_call_tool() -> None:
-    """Test call parameterless tool."""
+async def test_add_tools_conflict() -> None:
+    """Test that no tool is added when one of a batch conflicts."""
     app = Server()
 
     @app.add_tool
@@ -128,26 +145,47 @@ async def test_call_tool() -> None:
         """Say hello."""
         return "Hello"
 
+    async def echo(msg: str) -> str:
+        """Echo the message back."""
+        return msg
+
+    with pytest.raises(ValueError):
+        app.add_tools([echo, say_hello])
+
+    async with AsyncTestClient(app) as client:
+        tools = await client.tools.list()
+        assert [tool["name"] for tool in tools] == ["say_hello"]
+
+
+async def test_clone_isolation() -> None:
+    """Test that a clone shares existing tools but not ones added later."""
+    template = Server()
+
+    @template.add_tool
+    async def say_hello() -> str:
+        """Say hello."""
+        return "Hello"
+
+    app = template.clone()
+
     @app.add_tool
-    async def add(x: int, y: int) -> int:
-        """Add two integers."""
-        return x + y
+    async def echo(msg: str) -> str:
+        """Echo the message back."""
+        return msg
 
-    async with get_async_test_client(app) as client:
-        response = await client.tools.call(
-            "say_hello",
-            {},
-        )
+    async with AsyncTestClient(app) as client:
+        tools = await client.tools.list()
+        assert [tool["name"] for tool in tools] == ["say_hello", "echo"]
+        result = await client.tools.call("say_hello", {})
+        assert result["value"] == "Hello"
 
-        assert response == {
-            "call_id": AnyStr(),
-            "value": "Hello",
-            "success": True,
-        }
+    async with AsyncTestClient(template) as client:
+        tools = await client.tools.list()
+        assert [tool["name"] for tool in tools] == ["say_hello"]
 
 
-async def test_create_langchain_tools_from_server() -> None:
-    """Test create langchain tools from server."""
+async def test_list_tools_cache() -> None:
+    """Test that the client reuses tool lists while caching is enabled."""
     app = Server()
 
     @app.add_tool
@@ -155,51 +193,127 @@ async def test_create_langchain_tools_from_server() -> None:
         """Say hello."""
         return "Hello"
 
-    @app.add_tool
-    async def add(x: int, y: int) -> int:
-        """Add two integers."""
-        return x + y
+    async with AsyncTestClient(app, tools_list_ttl=60) as client:
+        assert [tool["name"] for tool in await client.tools.list()] == ["say_hello"]
+
+        @app.add_tool
+        async def echo(msg: str) -> str:
+            """Echo the message back."""
+            return msg
+
+        # Served from the cache, as a new list each time
+        tools = await client.tools.list()
+        assert [tool["name"] for tool in tools] == ["say_hello"]
+        tools.clear()
+        assert [tool["name"] for tool in await client.tools.list()] == ["say_hello"]
+        # Cached separately for different per-request headers
+        tools = await client.tools.list(headers={"x-request": "1"})
+        assert [tool["name"] for tool in tools] == ["say_hello", "echo"]
+
+        # A call to an unknown tool invalidates the cache
+        with pytest.raises(HTTPStatusError) as exception_info:
+            await client.tools.call("does_not_exist", {})
+        assert exception_info.value.response.status_code == 404
+        tools = await client.tools.list()
+        assert [tool["name"] for tool in tools] == ["say_hello", "echo"]
+
+
+async def test_call_tool(tools_client: AsyncClient) -> None:
+    """Test call parameterless tool."""
+    response = await tools_client.tools.call(
+        "say_hello",
+        {},
+    )
+
+    assert response == {
+        "call_id": AnyStr,
+        "value": "Hello",
+        "success": True,
+    }
+
+
+async def test_batch_call(tools_client: AsyncClient) -> None:
+    """Test calling several tools in a single request."""
+    responses = await tools_client.tools.batch_call(
+        [
+            {"tool_id": "say_hello"},
+            {"tool_id": "echo", "input": {"msg": "hi"}},
+            {"tool_id": "add", "input": {"x": 1, "y": 2}, "call_id": "3"},
+        ]
+    )
+    assert responses == [
+        {"call_id": AnyStr, "value": "Hello", "success": True},
+        {"call_id": AnyStr, "value": "hi", "success": True},
+        {"call_id": "3", "value": 3, "success": True},
+    ]
+
+    with pytest.raises(HTTPStatusError) as exception_info:
+        await tools_client.tools.batch_call(
+            [{"tool_id": "say_hello"}, {"tool_id": "does_not_exist"}]
+        )
+    assert exception_info.value.response.status_code == 404
+
+
+async def test_call_tool_redirect_raises() -> None:
+    """Test that a redirect is raised as an error rather than decoded."""
+    transport = MockTransport(
+        lambda request: Response(307, headers={"location": "/elsewhere"})
+    )
+    async with get_async_client(transport=transport) as client:
+        with pytest.raises(HTTPStatusError) as exception_info:
+            await client.tools.call("say_hello", {})
+    assert exception_info.value.response.status_code == 307
+
 
-    async with get_async_test_client(app) as client:
-        tools = await client.tools.as_langchain_tools(tool_ids=["say_hello", "add"])
-        say_hello_client_side = tools[0]
-        add_client_side = tools[1]
+async def test_call_tool_with_large_output(tools_app: Server) -> None:
+    """Test call a tool whose response is streamed into a preallocated buffer."""
+    # Extend a copy of the shared server rather than building one from scratch.
+    app = tools_app.clone()
 
-        assert await say_hello_client_side.ainvoke({}) == "Hello"
-        assert say_hello_client_side.args_schema == {"properties": {}, "type": "object"}
+    @app.add_tool
+    async def repeat(text: str, times: int) -> list[str]:
+        """Repeat some text."""
+        return [text] * times
+
+    async with AsyncTestClient(app) as client:
+        response = await client.tools.call("repeat", {"text": "x" * 100, "times": 5000})
 
-        assert await add_client_side.ainvoke({"x": 1, "y": 2}) == 3
-        assert add_client_side.args == {
-            "x": {"type": "integer"},
-            "y": {"type": "integer"},
+        assert response == {
+            "call_id": AnyStr,
+            "value": ["x" * 100] * 5000,
+            "success": True,
         }
 
 
-class User(BaseUser):
-    """User class."""
+async def test_create_langchain_tools_from_server(tools_client: AsyncClient) -> None:
+    """Test create langchain tools from server."""
+    tools = await tools_client.tools.as_langchain_tools(tool_ids=["say_hello", "add"])
+    say_hello_client_side = tools[0]
+    add_client_side = tools[1]
+
+    assert await say_hello_client_side.ainvoke({}) == "Hello"
+    assert say_hello_client_side.args_schema == {"properties": {}, "type": "object"}
 
-    @property
-    def is_authenticated(self) -> bool:
-        """Check if user is authenticated."""
-        return True
+    assert await add_client_side.ainvoke({"x": 1, "y": 2}) == 3
+    assert add_client_side.args == {
+        "x": {"type": "integer"},
+        "y": {"type": "integer"},
+    }
 
-    @property
-    def display_name(self) -> str:
-        """Get user's display name."""
-        return "Test User"
 
-    @property
-    def identity(self) -> str:
-        """Get user's identity."""
-        return "test-user"
+class User(BaseUser):
+    """User class."""
+
+    is_authenticated = True
+    display_name = "Test User"
+    identity = "test-user"
 
 
 async def test_auth_list_tools() -> None:
     """Test ability to list tools."""
 
     app = Server()
-    auth = Auth()
-    app.add_auth(auth)
+    app.add_auth(make_auth(API_KEY_TO_USER))
 
     @app.add_tool(permissions=["group1"])
     async def say_hello() -> str:
@@ -211,34 +325,51 @@ async def test_auth_list_tools() -> None:
         """Add two integers."""
         return x + y
 
-    @auth.authenticate
-    async def authenticate(headers: dict[bytes, bytes]) -> dict:
-        """Authenticate incoming requests."""
-        # Validate credentials (e.g., API key, JWT token)
-        api_key = headers.get(b"x-api-key")
-        if not api_key or api_key != b"123":
-            raise auth.exceptions.HTTPException(detail="Not authorized")
+    async with AsyncTestClient(app, headers=AUTH_HEADERS["1"]) as client:
+        tools = await client.tools.list()
+        assert tools == [SAY_HELLO_SPEC]
 
-        return {"permissions": ["group1"], "identity": "some-user"}
+        await client.tools.call("say_hello", {})
 
-    async with get_async_test_client(app, headers={"x-api-key": "123"}) as client:
-        tools = await client.tools.list()
-        assert tools == [
+
+async def test_auth_list_tools_requires_all_permissions() -> None:
+    """Test that a tool is only listed if every permission it requires is granted."""
+    app = Server()
+    app.add_auth(
+        make_auth(
             {
-                "description": "Say hello.",
-                "id": "say_hello@1.0.0",
-                "input_schema": {"properties": {}, "type": "object"},
-                "name": "say_hello",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
+                b"1": {"permissions": ["group2"], "identity": "some-user"},
+                b"2": {"permissions": ["group2", "group1"], "identity": "another-user"},
             }
-        ]
+        )
+    )
 
-        await client.tools.call("say_hello", {})
+    @app.add_tool
+    async def public() -> str:
+        """Public tool."""
+        return "public"
 
+    @app.add_tool(permissions=["group1", "group2"])
+    async def both() -> str:
+        """Requires both groups."""
+        return "both"
 
-async def test_call_tool_with_auth() -> None:
-    """Test calling a tool with authentication provided."""
+    @app.add_tool(permissions=["group2"])
+    async def second() -> str:
+        """Requires the second group."""
+        return "second"
+
+    async with AsyncTestClient(app) as client:
+        tools = await client.tools.list(headers=AUTH_HEADERS["1"])
+        assert [tool["name"] for tool in tools] == ["public", "second"]
+
+        tools = await client.tools.list(headers=AUTH_HEADERS["2"])
+        assert [tool["name"] for tool in tools] == ["public", "both", "second"]
+
+
+@pytest.fixture(scope="module")
+def auth_app() -> Server:
+    """Server with a tool that only `group1` may call."""
     app = Server()
 
     @app.add_tool(permissions=["group1"])
@@ -246,105 +377,140 @@ async def test_call_tool_with_auth() -> None:
         """Say hello."""
         return "Hello"
 
-    auth = Auth()
-
-    @auth.authenticate
-    async def authenticate(headers: dict[bytes, bytes]) -> dict:
-        """Authenticate incoming requests."""
-        api_key = headers.get(b"x-api-key")
-
-        api_key_to_user = {
-            b"1": {"permissions": ["group1"], "identity": "some-user"},
-            b"2": {"permissions": ["group2"], "identity": "another-user"},
-        }
+    app.add_auth(make_auth(API_KEY_TO_USER))
+    return app
 
-        if not api_key or api_key not in api_key_to_user:
-            raise auth.exceptions.HTTPException(detail="Not authorized")
 
-        return api_key_to_user[api_key]
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def auth_client(auth_app: Server) -> AsyncGenerator[AsyncClient, None]:
+    """Client for `auth_app`, shared by every case."""
+    async with AsyncTestClient(auth_app) as client:
+        yield client
 
-    app.add_auth(auth)
 
-    async with get_async_test_client(app, headers={"x-api-key": "1"}) as client:
-        assert await client.tools.call("say_hello", {}) == {
-            "call_id": AnyStr(),
+@pytest.mark.parametrize(
+    "api_key, expected_status",
+    [
+        ("1", 200),
+        # `2` does not have permission to call `say_hello`
+        ("2", 403),
+        # `3` is not a known API key
+        ("3", 401),
+    ],
+)
+async def test_call_tool_with_auth(
+    auth_client: AsyncClient, api_key: str, expected_status: int
+) -> None:
+    """Test calling a tool with authentication provided."""
+    headers = AUTH_HEADERS[api_key]
+    if expected_status == 200:
+        assert await auth_client.tools.call("say_hello", {}, headers=headers) == {
+            "call_id": AnyStr,
             "value": "Hello",
             "success": True,
         }
-    async with get_async_test_client(app, headers={"x-api-key": "2"}) as client:
-        # `2` does not have permission to call `say_hello`
-        with pytest.raises(HTTPStatusError) as exception_info:
-            assert await client.tools.call("say_hello", {})
-        assert exception_info.value.response.status_code == 403
-
-    async with get_async_test_client(app, headers={"x-api-key": "3"}) as client:
-        # `3` does not have permission to call `say_hello`
+    else:
         with pytest.raises(HTTPStatusError) as exception_info:
-            assert await client.tools.call("say_hello", {})
-        assert exception_info.value.response.status_code == 401
-
-
-async def test_call_tool_with_injected() -> None:
-    """Test calling a tool with an injected request."""
-    app = Server()
+            await auth_client.tools.call("say_hello", {}, headers=headers)
+        assert exception_info.value.response.status_code == expected_status
 
-    @app.add_tool(permissions=["authorized"])
-    async def get_user_identity(request: Annotated[Request, InjectedRequest]) -> str:
-        """Get the user's identity."""
-        return request.user.identity
 
-    auth = Auth()
+async def test_batch_call_with_auth(auth_client: AsyncClient) -> None:
+    """Test that every call in a batch is checked against the user's permissions."""
+    calls = [{"tool_id": "say_hello"}, {"tool_id": "say_hello"}]
+    responses = await auth_client.tools.batch_call(calls, headers=AUTH_HEADERS["1"])
+    assert [response["value"] for response in responses] == ["Hello", "Hello"]
 
-    @auth.authenticate
-    async def authenticate(headers: dict[bytes, bytes]) -> dict:
-        """Authenticate incoming requests."""
-        # Validate credentials (e.g., API key, JWT token)
-        api_key = headers.get(b"x-api-key")
+    with pytest.raises(HTTPStatusError) as exception_info:
+        await auth_client.tools.batch_call(calls, headers=AUTH_HEADERS["2"])
+    assert exception_info.value.response.status_code == 403
 
-        api_key_to_user = {
-            b"1": {"permissions": ["authorized"], "identity": "some-user"},
-            b"2": {"permissions": ["authorized"], "identity": "another-user"},
-            b"3": {"permissions": ["not-authorized"], "identity": "not-authorized"},
-        }
 
-        if not api_key or api_key not in api_key_to_user:
-            raise auth.exceptions.HTTPException(detail="Not authorized")
+async def test_per_request_headers() -> None:
+    """Test passing credentials per request on a shared client."""
+    app = Server()
 
-        return api_key_to_user[api_key]
+    @app.add_tool(permissions=["group1"])
+    async def say_hello() -> str:
+        """Say hello."""
+        return "Hello"
 
-    app.add_auth(auth)
+    app.add_auth(make_auth(API_KEY_TO_USER))
 
-    async with get_async_test_client(app, headers={"x-api-key": "1"}) as client:
-        result = await client.tools.call("get_user_identity")
-        assert result["value"] == "some-user"
+    async with AsyncTestClient(app) as client:
+        tools = await client.tools.list(headers=AUTH_HEADERS["1"])
+        assert [tool["name"] for tool in tools] == ["say_hello"]
+        assert await client.tools.list(headers=AUTH_HEADERS["2"]) == []
 
-    async with get_async_test_client(app, headers={"x-api-key": "2"}) as client:
-        result = await client.tools.call("get_user_identity")
-        assert result["value"] == "another-user"
+        result = await client.tools.call("say_hello", {}, headers=AUTH_HEADERS["1"])
+        assert result["value"] == "Hello"
 
-    async with get_async_test_client(app, headers={"x-api-key": "3"}) as client:
         with pytest.raises(HTTPStatusError) as exception_info:
-            await client.tools.call("get_user_identity", {})
+            await client.tools.call("say_hello", {}, headers=AUTH_HEADERS["2"])
         assert exception_info.value.response.status_code == 403
 
-    # Authenticated but tool does not exist
-    async with get_async_test_client(app, headers={"x-api-key": "1"}) as client:
         with pytest.raises(HTTPStatusError) as exception_info:
-            await client.tools.call("does_not_exist", {})
-        assert exception_info.value.response.status_code == 403
+            await client.tools.list()
+        assert exception_info.value.response.status_code == 401
 
-    # Not authenticated
-    async with get_async_test_client(app, headers={"x-api-key": "6"}) as client:
-        # Make sure this raises 401?
-        with pytest.raises(HTTPStatusError) as exception_info:
-            await client.tools.call("does_not_exist", {})
 
-        assert exception_info.value.response.status_code == 401
+@pytest.fixture(scope="module")
+def injected_app() -> Server:
+    """Server with a tool that returns the identity of the injected request."""
+    app = Server()
+
+    @app.add_tool(permissions=["authorized"])
+    async def get_user_identity(request: Annotated[Request, InjectedRequest]) -> str:
+        """Get the user's identity."""
+        return request.user.identity
 
+    app.add_auth(make_auth(API_KEY_TO_AUTHORIZED_USER))
+    return app
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def injected_client(injected_app: Server) -> AsyncGenerator[AsyncClient, None]:
+    """Client for `injected_app`, shared by every case."""
+    async with AsyncTestClient(injected_app) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "api_key, tool_id, args, expected_status, expected_value",
+    [
+        # No input, so the tool only gets the injected request
+        ("1", "get_user_identity", None, 200, "some-user"),
+        ("2", "get_user_identity", None, 200, "another-user"),
+        ("1", "get_user_identity", {}, 200, "some-user"),
+        ("3", "get_user_identity", {}, 403, None),
+        # Authenticated but tool does not exist
+        ("1", "does_not_exist", {}, 403, None),
+        # Not authenticated
+        ("6", "does_not_exist", {}, 401, None),
+    ],
+)
+async def test_call_tool_with_injected(
+    injected_client: AsyncClient,
+    api_key: str,
+    tool_id: str,
+    args: Optional[dict],
+    expected_status: int,
+    expected_value: Optional[str],
+) -> None:
+    """Test calling a tool with an injected request."""
+    headers = AUTH_HEADERS[api_key]
+    if expected_status == 200:
+        result = await injected_client.tools.call(tool_id, args, headers=headers)
+        assert result["value"] == expected_value
+    else:
+        with pytest.raises(HTTPStatusError) as exception_info:
+            await injected_client.tools.call(tool_id, args, headers=headers)
+        assert exception_info.value.response.status_code == expected_status
 
-async def test_exposing_existing_langchain_tools() -> None:
-    """Test exposing existing langchain tools."""
-    from langchain_core.tools import StructuredTool, tool
+
+@pytest.fixture(scope="module")
+def langchain_tools() -> tuple[BaseTool, BaseTool, BaseTool]:
+    """Tools built with langchain directly rather than through the server."""
 
     @tool
     def say_hello_sync() -> str:
@@ -365,79 +531,51 @@ async def test_exposing_existing_langchain_tools() -> None:
         return a * b
 
     calculator = StructuredTool.from_function(func=multiply, coroutine=amultiply)
+    return say_hello_sync, say_hello_async, calculator
 
-    server = Server()
-    auth = Auth()
-    server.add_auth(auth)
-
-    @auth.authenticate
-    async def authenticate(headers: dict) -> dict:
-        """Authenticate incoming requests."""
-        api_key = headers.get(b"x-api-key")
 
-        api_key_to_user = {
-            b"1": {"permissions": ["group1"], "identity": "some-user"},
-        }
-
-        if not api_key or api_key not in api_key_to_user:
-            raise auth.exceptions.HTTPException(detail="Not authorized")
+async def test_exposing_existing_langchain_tools(
+    langchain_tools: tuple[BaseTool, BaseTool, BaseTool],
+) -> None:
+    """Test exposing existing langchain tools."""
+    say_hello_sync, say_hello_async, calculator = langchain_tools
 
-        return api_key_to_user[api_key]
+    server = Server()
+    server.add_auth(make_auth(API_KEY_TO_USER))
 
     server.add_tool(say_hello_sync, permissions=["group1"])
     server.add_tool(say_hello_async, permissions=["group1"])
     server.add_tool(calculator, permissions=["group1"])
 
-    async with get_async_test_client(server, headers={"x-api-key": "1"}) as client:
+    async with AsyncTestClient(server, headers=AUTH_HEADERS["1"]) as client:
         tools = await client.tools.list()
         assert tools == [
+            {**SAY_HELLO_SPEC, "id": "say_hello_sync@1.0.0", "name": "say_hello_sync"},
             {
-                "description": "Say hello.",
-                "id": "say_hello_sync@1.0.0",
-                "input_schema": {"properties": {}, "type": "object"},
-                "name": "say_hello_sync",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
-            },
-            {
-                "description": "Say hello.",
+                **SAY_HELLO_SPEC,
                 "id": "say_hello_async@1.0.0",
-                "input_schema": {"properties": {}, "type": "object"},
                 "name": "say_hello_async",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
-            },
-            {
-                "description": "Multiply two numbers.",
-                "id": "multiply@1.0.0",
-                "input_schema": {
-                    "properties": {"a": {"type": "integer"}, "b": {"type": "integer"}},
-                    "required": ["a", "b"],
-                    "type": "object",
-                },
-                "name": "multiply",
-                "output_schema": {"type": "integer"},
-                "version": "1.0.0",
             },
+            MULTIPLY_SPEC,
         ]
 
         result = await client.tools.call("say_hello_sync", {})
         assert result == {
-            "call_id": AnyStr(),
+            "call_id": AnyStr,
             "value": "Hello",
             "success": True,
         }
 
         result = await client.tools.call("say_hello_async", {})
         assert result == {
-            "call_id": AnyStr(),
+            "call_id": AnyStr,
             "value": "Hello",
             "success": True,
         }
 
         result = await client.tools.call("multiply", {"a": 2, "b": 3})
         assert result == {
-            "call_id": AnyStr(),
+            "call_id": AnyStr,
             "value": 6,
             "success": True,
         }
@@ -457,59 +595,40 @@ async def test_call_tool_by_version() -> None:
         """Say hello."""
         return "v2"
 
-    async with get_async_test_client(app) as client:
+    async with AsyncTestClient(app) as client:
         tools = await client.tools.list()
         assert tools == [
-            {
-                "description": "Say hello.",
-                "id": "say_hello@1.0.0",
-                "input_schema": {"properties": {}, "type": "object"},
-                "name": "say_hello",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
-            },
-            {
-                "description": "Say hello.",
-                "id": "say_hello@2.0.0",
-                "input_schema": {"properties": {}, "type": "object"},
-                "name": "say_hello",
-                "output_schema": {"type": "string"},
-                "version": "2.0.0",
-            },
+            SAY_HELLO_SPEC,
+            {**SAY_HELLO_SPEC, "id": "say_hello@2.0.0", "version": "2.0.0"},
         ]
 
-        # call the tool by version
-        result = await client.tools.call("say_hello@1", {})
-        assert result == {
-            "call_id": AnyStr(),
-            "value": "v1",
-            "success": True,
-        }
-
-        result = await client.tools.call("say_hello@1.0.0", {})
-        assert result == {
-            "call_id": AnyStr(),
-            "value": "v1",
-            "success": True,
-        }
-
-        result = await client.tools.call("say_hello@2", {})
-        assert result == {
-            "call_id": AnyStr(),
-            "value": "v2",
-            "success": True,
-        }
+        # call the tool by version; the calls are independent of each other
+        tool_ids_and_values = [
+            ("say_hello@1", "v1"),
+            ("say_hello@1.0.0", "v1"),
+            ("say_hello@2", "v2"),
+            ("say_hello@2.0", "v2"),
+            ("say_hello", "v2"),
+        ]
+        results = await asyncio.gather(
+            *(client.tools.call(tool_id, {}) for tool_id, _ in tool_ids_and_values)
+        )
+        assert results == [
+            {"call_id": AnyStr, "value": value, "success": True}
+            for _, value in tool_ids_and_values
+        ]
 
-        result = await client.tools.call("say_hello@2.0", {})
-        assert result == {
-            "call_id": AnyStr(),
-            "value": "v2",
-            "success": True,
-        }
 
-        result = await client.tools.call("say_hello", {})
-        assert result == {
-            "call_id": AnyStr(),
-            "value": "v2",
-            "success": True,
-        }
+async def test_list_cache_is_bounded() -> None:
+    """Test that the tool list cache evicts entries once it is full."""
+    cache = _ListCache(maxsize=2)
+    cache.set(frozenset({("x-request", "1")}), [], -1)
+    cache.set(frozenset({("x-request", "2")}), [], 60)
+    cache.set(frozenset({("x-request", "3")}), [], 60)
+    # The expired entry is evicted first
+    assert cache.get(frozenset({("x-request", "2")})) == []
+    cache.set(None, [], 60)
+    # Then the oldest one
+    assert cache.get(frozenset({("x-request", "2")})) is None
+    assert cache.get(frozenset({("x-request", "3")})) == []
+    assert cache.get(None) == []
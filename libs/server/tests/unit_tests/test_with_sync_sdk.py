@@ -1,73 +1,71 @@
 """Test the server."""
 
-from contextlib import contextmanager
-from typing import Annotated, Generator, Optional
+from importlib.util import find_spec
+from typing import Annotated, Any, Generator, Optional
 
 import pytest
 from fastapi import FastAPI
-from httpx import HTTPStatusError
+from httpx import HTTPStatusError, MockTransport, Response
+from langchain_core.tools import BaseTool, StructuredTool, tool
 from starlette.authentication import BaseUser
 from starlette.requests import Request
-from universal_tool_client import SyncClient
+from starlette.testclient import TestClient
+from universal_tool_client import SyncClient, get_sync_client
 
 from universal_tool_server import Server
 from universal_tool_server._version import __version__
-from universal_tool_server.auth import Auth
 from universal_tool_server.tools import InjectedRequest
 
-from ..unit_tests.utils import AnyStr
-
-
-@contextmanager
-def get_sync_test_client(
-    server: FastAPI,
-    *,
-    path: Optional[str] = None,
-    raise_app_exceptions: bool = True,
-    headers: dict[str, str] | None = None,
-) -> Generator[SyncClient, None, None]:
-    """Get an async client."""
-    url = "http://localhost:9999"
-    if path:
-        url += path
-
-    from starlette.testclient import TestClient
-
-    client = TestClient(
-        server, raise_server_exceptions=raise_app_exceptions, headers=headers
-    )
-
-    try:
-        yield SyncClient(client)
-    finally:
-        del client
-
-
-def test_health() -> None:
-    app = Server()
-    with get_sync_test_client(app) as client:
-        assert client.health() == {
-            "status": "OK",
-        }
+from ..unit_tests.utils import (
+    ADD_SPEC,
+    API_KEY_TO_AUTHORIZED_USER,
+    API_KEY_TO_USER,
+    AUTH_HEADERS,
+    ECHO_SPEC,
+    MULTIPLY_SPEC,
+    SAY_HELLO_SPEC,
+    AnyStr,
+    make_auth,
+)
+
+# The test client runs the app in an anyio event loop; use uvloop when available.
+_BACKEND_OPTIONS = {"use_uvloop": True} if find_spec("uvloop") else {}
+
+
+class SyncTestClient:
+    """Context manager that opens a client for a server."""
+
+    def __init__(
+        self,
+        server: FastAPI,
+        *,
+        raise_app_exceptions: bool = True,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self._server = server
+        self._raise_app_exceptions = raise_app_exceptions
+        self._headers = headers
+        self._client: Optional[TestClient] = None
+
+    def __enter__(self) -> SyncClient:
+        self._client = TestClient(
+            self._server,
+            raise_server_exceptions=self._raise_app_exceptions,
+            headers=self._headers,
+            backend_options=_BACKEND_OPTIONS,
+        )
+        return SyncClient(self._client)
 
-
-def test_info() -> None:
-    app = Server()
-    with get_sync_test_client(app) as client:
-        assert client.info() == {
-            "version": __version__,
-        }
+    def __exit__(self, *exc_info: Any) -> None:
+        self._client.close()
+        self._client = None
 
 
-def test_add_langchain_tool() -> None:
-    """Test adding a tool that's defined using langchain tool decorator."""
+@pytest.fixture(scope="module")
+def tools_app() -> Server:
+    """Server with a few tools, shared by tests that do not modify it."""
     app = Server()
 
-    # Test prior to adding any tools
-    with get_sync_test_client(app) as client:
-        tools = client.tools.list()
-        assert tools == []
-
     @app.add_tool
     def say_hello() -> str:
         """Say hello."""
@@ -83,207 +81,164 @@ def test_add_langchain_tool() -> None:
         """Add two integers."""
         return x + y
 
-    with get_sync_test_client(app) as client:
-        data = client.tools.list()
-        assert data == [
-            {
-                "description": "Say hello.",
-                "id": "say_hello@1.0.0",
-                "input_schema": {"properties": {}, "type": "object"},
-                "name": "say_hello",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
-            },
-            {
-                "description": "Echo the message back.",
-                "id": "echo@1.0.0",
-                "input_schema": {
-                    "properties": {"msg": {"type": "string"}},
-                    "required": ["msg"],
-                    "type": "object",
-                },
-                "name": "echo",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
-            },
-            {
-                "description": "Add two integers.",
-                "id": "add@1.0.0",
-                "input_schema": {
-                    "properties": {"x": {"type": "integer"}, "y": {"type": "integer"}},
-                    "required": ["x", "y"],
-                    "type": "object",
-                },
-                "name": "add",
-                "output_schema": {"type": "integer"},
-                "version": "1.0.0",
-            },
-        ]
+    return app
 
 
-def test_call_tool() -> None:
-    """Test call parameterless tool."""
-    app = Server()
+@pytest.fixture(scope="module")
+def tools_client(tools_app: Server) -> Generator[SyncClient, None, None]:
+    """Client for `tools_app`, shared by the tests that use it."""
+    with SyncTestClient(tools_app) as client:
+        yield client
 
-    @app.add_tool
-    def say_hello() -> str:
-        """Say hello."""
-        return "Hello"
 
-    @app.add_tool
-    def add(x: int, y: int) -> int:
-        """Add two integers."""
-        return x + y
+def test_health(tools_client: SyncClient) -> None:
+    assert tools_client.health() == {
+        "status": "OK",
+    }
 
-    with get_sync_test_client(app) as client:
-        response = client.tools.call(
-            "say_hello",
-            {},
-        )
 
-        assert response == {
-            "call_id": AnyStr(),
-            "value": "Hello",
-            "success": True,
-        }
+def test_info(tools_client: SyncClient) -> None:
+    assert tools_client.info() == {
+        "version": __version__,
+    }
 
 
-def test_create_langchain_tools_from_server() -> None:
-    """Test create langchain tools from server."""
-    app = Server()
+@pytest.fixture(scope="module")
+def empty_server() -> Server:
+    """Server without any tools."""
+    return Server()
 
-    @app.add_tool
-    def say_hello() -> str:
-        """Say hello."""
-        return "Hello"
-
-    @app.add_tool
-    def add(x: int, y: int) -> int:
-        """Add two integers."""
-        return x + y
-
-    with get_sync_test_client(app) as client:
-        tools = client.tools.as_langchain_tools(tool_ids=["say_hello", "add"])
-        say_hello_client_side = tools[0]
-        add_client_side = tools[1]
 
-        assert say_hello_client_side.invoke({}) == "Hello"
-        assert say_hello_client_side.args_schema == {"properties": {}, "type": "object"}
+def test_add_langchain_tool(empty_server: Server, tools_client: SyncClient) -> None:
+    """Test adding a tool that's defined using langchain tool decorator."""
+    # Test prior to adding any tools
+    with SyncTestClient(empty_server) as client:
+        tools = client.tools.list()
+        assert tools == []
 
-        assert add_client_side.invoke({"x": 1, "y": 2}) == 3
-        assert add_client_side.args == {
-            "x": {"type": "integer"},
-            "y": {"type": "integer"},
-        }
+    data = tools_client.tools.list()
+    assert data == [
+        SAY_HELLO_SPEC,
+        ECHO_SPEC,
+        ADD_SPEC,
+    ]
 
 
-class User(BaseUser):
-    """User class."""
+def test_call_tool(tools_client: SyncClient) -> None:
+    """Test call parameterless tool."""
+    response = tools_client.tools.call(
+        "say_hello",
+        {},
+    )
 
-    @property
-    def is_authenticated(self) -> bool:
-        """Check if user is authenticated."""
-        return True
+    assert response == {
+        "call_id": AnyStr,
+        "value": "Hello",
+        "success": True,
+    }
 
-    @property
-    def display_name(self) -> str:
-        """Get user's display name."""
-        return "Test User"
 
-    @property
-    def identity(self) -> str:
-        """Get user's identity."""
-        return "test-user"
+def test_call_tool_redirect_raises() -> None:
+    """Test that a redirect is raised as an error rather than decoded."""
+    transport = MockTransport(
+        lambda request: Response(307, headers={"location": "/elsewhere"})
+    )
+    with get_sync_client(transport=transport) as client:
+        with pytest.raises(HTTPStatusError) as exception_info:
+            client.tools.call("say_hello", {})
+    assert exception_info.value.response.status_code == 307
 
 
-def test_auth_list_tools() -> None:
-    """Test ability to list tools."""
+def test_batch_call(tools_client: SyncClient) -> None:
+    """Test calling several tools in a single request."""
+    responses = tools_client.tools.batch_call(
+        [
+            {"tool_id": "say_hello"},
+            {"tool_id": "add", "input": {"x": 1, "y": 2}, "call_id": "2"},
+        ]
+    )
+    assert responses == [
+        {"call_id": AnyStr, "value": "Hello", "success": True},
+        {"call_id": "2", "value": 3, "success": True},
+    ]
 
-    app = Server()
-    auth = Auth()
-    app.add_auth(auth)
 
-    @app.add_tool(permissions=["group1"])
-    def say_hello() -> str:
-        """Say hello."""
-        return "Hello"
+def test_create_langchain_tools_from_server(tools_client: SyncClient) -> None:
+    """Test create langchain tools from server."""
+    tools = tools_client.tools.as_langchain_tools(tool_ids=["say_hello", "add"])
+    say_hello_client_side = tools[0]
+    add_client_side = tools[1]
 
-    @app.add_tool(permissions=["group2"])
-    def add(x: int, y: int) -> int:
-        """Add two integers."""
-        return x + y
+    assert say_hello_client_side.invoke({}) == "Hello"
+    assert say_hello_client_side.args_schema == {"properties": {}, "type": "object"}
 
-    @auth.authenticate
-    async def authenticate(headers: dict[bytes, bytes]) -> dict:
-        """Authenticate incoming requests."""
-        # Validate credentials (e.g., API key, JWT token)
-        api_key = headers.get(b"x-api-key")
-        if not api_key or api_key != b"123":
-            raise auth.exceptions.HTTPException(detail="Not authorized")
+    assert add_client_side.invoke({"x": 1, "y": 2}) == 3
+    assert add_client_side.args == {
+        "x": {"type": "integer"},
+        "y": {"type": "integer"},
+    }
 
-        return {"permissions": ["group1"], "identity": "some-user"}
 
-    with get_sync_test_client(app, headers={"x-api-key": "123"}) as client:
-        tools = client.tools.list()
-        assert tools == [
-            {
-                "description": "Say hello.",
-                "id": "say_hello@1.0.0",
-                "input_schema": {"properties": {}, "type": "object"},
-                "name": "say_hello",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
-            }
-        ]
+class User(BaseUser):
+    """User class."""
 
-        client.tools.call("say_hello", {})
+    is_authenticated = True
+    display_name = "Test User"
+    identity = "test-user"
 
 
-async def test_call_tool_with_auth() -> None:
-    """Test calling a tool with authentication provided."""
+@pytest.fixture(scope="module")
+def auth_app() -> Server:
+    """Server with tools that only `group1` or `group2` may call."""
     app = Server()
+    app.add_auth(make_auth(API_KEY_TO_USER))
 
     @app.add_tool(permissions=["group1"])
     def say_hello(request: Annotated[Request, InjectedRequest]) -> str:
         """Say hello."""
         return "Hello"
 
-    auth = Auth()
+    @app.add_tool(permissions=["group2"])
+    def add(x: int, y: int) -> int:
+        """Add two integers."""
+        return x + y
 
-    @auth.authenticate
-    async def authenticate(headers: dict[bytes, bytes]) -> dict:
-        """Authenticate incoming requests."""
-        api_key = headers.get(b"x-api-key")
+    return app
 
-        api_key_to_user = {
-            b"1": {"permissions": ["group1"], "identity": "some-user"},
-            b"2": {"permissions": ["group2"], "identity": "another-user"},
-        }
 
-        if not api_key or api_key not in api_key_to_user:
-            raise auth.exceptions.HTTPException(detail="Not authorized")
+@pytest.fixture(scope="module")
+def auth_client(auth_app: Server) -> Generator[SyncClient, None, None]:
+    """Client for `auth_app`, passing the API key per request."""
+    with SyncTestClient(auth_app) as client:
+        yield client
 
-        return api_key_to_user[api_key]
 
-    app.add_auth(auth)
+def test_auth_list_tools(auth_client: SyncClient) -> None:
+    """Test ability to list tools."""
+    tools = auth_client.tools.list(headers=AUTH_HEADERS["1"])
+    assert tools == [SAY_HELLO_SPEC]
 
-    with get_sync_test_client(app, headers={"x-api-key": "1"}) as client:
-        assert client.tools.call("say_hello", {}) == {
-            "call_id": AnyStr(),
-            "value": "Hello",
-            "success": True,
-        }
-    with get_sync_test_client(app, headers={"x-api-key": "2"}) as client:
-        # `2` does not have permission to call `say_hello`
-        with pytest.raises(HTTPStatusError) as exception_info:
-            assert client.tools.call("say_hello", {})
-        assert exception_info.value.response.status_code == 403
+    tools = auth_client.tools.list(headers=AUTH_HEADERS["2"])
+    assert [tool["name"] for tool in tools] == ["add"]
 
-    with get_sync_test_client(app, headers={"x-api-key": "3"}) as client:
-        # `3` does not have permission to call `say_hello`
-        with pytest.raises(HTTPStatusError) as exception_info:
-            assert client.tools.call("say_hello", {})
-        assert exception_info.value.response.status_code == 401
+
+def test_call_tool_with_auth(auth_client: SyncClient) -> None:
+    """Test calling a tool with authentication provided."""
+    assert auth_client.tools.call("say_hello", {}, headers=AUTH_HEADERS["1"]) == {
+        "call_id": AnyStr,
+        "value": "Hello",
+        "success": True,
+    }
+
+    # `2` does not have permission to call `say_hello`
+    with pytest.raises(HTTPStatusError) as exception_info:
+        auth_client.tools.call("say_hello", {}, headers=AUTH_HEADERS["2"])
+    assert exception_info.value.response.status_code == 403
+
+    # `3` is not a known API key
+    with pytest.raises(HTTPStatusError) as exception_info:
+        auth_client.tools.call("say_hello", {}, headers=AUTH_HEADERS["3"])
+    assert exception_info.value.response.status_code == 401
 
 
 async def test_call_tool_with_injected() -> None:
@@ -295,58 +250,33 @@ async def test_call_tool_with_injected() -> None:
         """Get the user's identity."""
         return request.user.identity
 
-    auth = Auth()
-
-    @auth.authenticate
-    async def authenticate(headers: dict[bytes, bytes]) -> dict:
-        """Authenticate incoming requests."""
-        # Validate credentials (e.g., API key, JWT token)
-        api_key = headers.get(b"x-api-key")
-
-        api_key_to_user = {
-            b"1": {"permissions": ["authorized"], "identity": "some-user"},
-            b"2": {"permissions": ["authorized"], "identity": "another-user"},
-            b"3": {"permissions": ["not-authorized"], "identity": "not-authorized"},
-        }
-
-        if not api_key or api_key not in api_key_to_user:
-            raise auth.exceptions.HTTPException(detail="Not authorized")
+    app.add_auth(make_auth(API_KEY_TO_AUTHORIZED_USER))
 
-        return api_key_to_user[api_key]
-
-    app.add_auth(auth)
-
-    with get_sync_test_client(app, headers={"x-api-key": "1"}) as client:
-        result = client.tools.call("get_user_identity")
+    with SyncTestClient(app) as client:
+        result = client.tools.call("get_user_identity", headers=AUTH_HEADERS["1"])
         assert result["value"] == "some-user"
 
-    with get_sync_test_client(app, headers={"x-api-key": "2"}) as client:
-        result = client.tools.call("get_user_identity")
+        result = client.tools.call("get_user_identity", headers=AUTH_HEADERS["2"])
         assert result["value"] == "another-user"
 
-    with get_sync_test_client(app, headers={"x-api-key": "3"}) as client:
         with pytest.raises(HTTPStatusError) as exception_info:
-            client.tools.call("get_user_identity", {})
+            client.tools.call("get_user_identity", {}, headers=AUTH_HEADERS["3"])
         assert exception_info.value.response.status_code == 403
 
-    # Authenticated but tool does not exist
-    with get_sync_test_client(app, headers={"x-api-key": "1"}) as client:
+        # Authenticated but tool does not exist
         with pytest.raises(HTTPStatusError) as exception_info:
-            client.tools.call("does_not_exist", {})
+            client.tools.call("does_not_exist", {}, headers=AUTH_HEADERS["1"])
         assert exception_info.value.response.status_code == 403
 
-    # Not authenticated
-    with get_sync_test_client(app, headers={"x-api-key": "6"}) as client:
-        # Make sure this raises 401?
+        # Not authenticated
         with pytest.raises(HTTPStatusError) as exception_info:
-            client.tools.call("does_not_exist", {})
-
+            client.tools.call("does_not_exist", {}, headers=AUTH_HEADERS["6"])
         assert exception_info.value.response.status_code == 401
 
 
-async def test_exposing_existing_langchain_tools() -> None:
-    """Test exposing existing langchain tools."""
-    from langchain_core.tools import StructuredTool, tool
+@pytest.fixture(scope="module")
+def langchain_tools() -> tuple[BaseTool, BaseTool, BaseTool]:
+    """Tools built with langchain directly rather than through the server."""
 
     @tool
     def say_hello_sync() -> str:
@@ -367,79 +297,51 @@ async def test_exposing_existing_langchain_tools() -> None:
         return a * b
 
     calculator = StructuredTool.from_function(func=multiply, coroutine=amultiply)
+    return say_hello_sync, say_hello_async, calculator
 
-    server = Server()
-    auth = Auth()
-    server.add_auth(auth)
-
-    @auth.authenticate
-    async def authenticate(headers: dict) -> dict:
-        """Authenticate incoming requests."""
-        api_key = headers.get(b"x-api-key")
-
-        api_key_to_user = {
-            b"1": {"permissions": ["group1"], "identity": "some-user"},
-        }
 
-        if not api_key or api_key not in api_key_to_user:
-            raise auth.exceptions.HTTPException(detail="Not authorized")
+async def test_exposing_existing_langchain_tools(
+    langchain_tools: tuple[BaseTool, BaseTool, BaseTool],
+) -> None:
+    """Test exposing existing langchain tools."""
+    say_hello_sync, say_hello_async, calculator = langchain_tools
 
-        return api_key_to_user[api_key]
+    server = Server()
+    server.add_auth(make_auth(API_KEY_TO_USER))
 
     server.add_tool(say_hello_sync, permissions=["group1"])
     server.add_tool(say_hello_async, permissions=["group1"])
     server.add_tool(calculator, permissions=["group1"])
 
-    with get_sync_test_client(server, headers={"x-api-key": "1"}) as client:
+    with SyncTestClient(server, headers=AUTH_HEADERS["1"]) as client:
         tools = client.tools.list()
         assert tools == [
+            {**SAY_HELLO_SPEC, "id": "say_hello_sync@1.0.0", "name": "say_hello_sync"},
             {
-                "description": "Say hello.",
-                "id": "say_hello_sync@1.0.0",
-                "input_schema": {"properties": {}, "type": "object"},
-                "name": "say_hello_sync",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
-            },
-            {
-                "description": "Say hello.",
+                **SAY_HELLO_SPEC,
                 "id": "say_hello_async@1.0.0",
-                "input_schema": {"properties": {}, "type": "object"},
                 "name": "say_hello_async",
-                "output_schema": {"type": "string"},
-                "version": "1.0.0",
-            },
-            {
-                "description": "Multiply two numbers.",
-                "id": "multiply@1.0.0",
-                "input_schema": {
-                    "properties": {"a": {"type": "integer"}, "b": {"type": "integer"}},
-                    "required": ["a", "b"],
-                    "type": "object",
-                },
-                "name": "multiply",
-                "output_schema": {"type": "integer"},
-                "version": "1.0.0",
             },
+            MULTIPLY_SPEC,
         ]
 
         result = client.tools.call("say_hello_sync", {})
         assert result == {
-            "call_id": AnyStr(),
+            "call_id": AnyStr,
             "value": "Hello",
             "success": True,
         }
 
         result = client.tools.call("say_hello_async", {})
         assert result == {
-            "call_id": AnyStr(),
+            "call_id": AnyStr,
             "value": "Hello",
             "success": True,
         }
 
         result = client.tools.call("multiply", {"a": 2, "b": 3})
         assert result == {
-            "call_id": AnyStr(),
+            "call_id": AnyStr,
             "value": 6,
             "success": True,
         }
@@ -1,17 +1,20 @@
 """Test the server."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Annotated, AsyncGenerator, Optional
 
+import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from starlette.requests import Request
+from starlette.testclient import TestClient
 
 from universal_tool_server import Server
 from universal_tool_server._version import __version__
 from universal_tool_server.tools import InjectedRequest
 
-from ..unit_tests.utils import AnyStr
+from ..unit_tests.utils import AnyStr, call_asgi
 
 
 @asynccontextmanager
@@ -33,34 +36,34 @@ async def get_async_test_client(
         await async_client.aclose()
 
 
-async def test_health() -> None:
-    app = Server()
-    async with get_async_test_client(app) as client:
-        response = await client.get("/health")
-        response.raise_for_status()
-        assert response.json() == {"status": "OK"}
+@pytest.fixture(scope="module")
+def empty_server() -> Server:
+    """Server without any tools, shared by tests that do not modify it."""
+    return Server()
+
 
+async def test_health(empty_server: Server) -> None:
+    response = await call_asgi(empty_server, "GET", "/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "OK"}
 
-async def test_info() -> None:
+
+async def test_info(empty_server: Server) -> None:
     """Test info end-point."""
-    app = Server()
-    async with get_async_test_client(app) as client:
-        response = await client.get("/info")
-        response.raise_for_status()
-        json_data = response.json()
-        assert json_data == {
-            "version": __version__,
-        }
+    response = await call_asgi(empty_server, "GET", "/info")
+    assert response.status_code == 200
+    json_data = response.json()
+    assert json_data == {
+        "version": __version__,
+    }
 
 
-async def test_list_tools() -> None:
+async def test_list_tools(empty_server: Server) -> None:
     """Test list tools."""
-    app = Server()
-    async with get_async_test_client(app) as client:
-        response = await client.get("/tools")
-        response.raise_for_status()
-        json_data = response.json()
-        assert json_data == []
+    response = await call_asgi(empty_server, "GET", "/tools")
+    assert response.status_code == 200
+    json_data = response.json()
+    assert json_data == []
 
 
 async def test_422() -> None:
@@ -83,14 +86,51 @@ async def test_422() -> None:
         )
 
 
-async def test_lifespan() -> None:
-    import contextlib
+async def test_call_tool_with_big_int() -> None:
+    """Test a tool result that orjson cannot encode."""
+    app = Server()
+
+    @app.add_tool()
+    def big() -> int:
+        """Return an integer outside of the 64-bit range."""
+        return 2**70
+
+    async with get_async_test_client(app) as client:
+        response = await client.post(
+            "/tools/call", json={"request": {"tool_id": "big", "input": {}}}
+        )
+        response.raise_for_status()
+        assert response.json()["value"] == 2**70
+
 
-    from starlette.testclient import TestClient
+async def test_concurrent_calls() -> None:
+    """Test many concurrent calls on a single client."""
+    app = Server()
 
+    @app.add_tool()
+    async def echo(number: int) -> int:
+        """Echo a number."""
+        return number
+
+    async with get_async_test_client(app) as client:
+        responses = await asyncio.gather(
+            *(
+                client.post(
+                    "/tools/call",
+                    json={"request": {"tool_id": "echo", "input": {"number": i}}},
+                )
+                for i in range(50)
+            )
+        )
+    for i, response in enumerate(responses):
+        response.raise_for_status()
+        assert response.json()["value"] == i
+
+
+async def test_lifespan() -> None:
     calls = []
 
-    @contextlib.asynccontextmanager
+    @asynccontextmanager
     async def lifespan(app):
         calls.append("startup")
         yield {"foo": "bar"}
@@ -117,7 +157,7 @@ async def test_lifespan() -> None:
         assert result == {
             "value": "bar",
             "success": True,
-            "call_id": AnyStr(),
+            "call_id": AnyStr,
         }
 
     assert calls == ["startup", "shutdown"]
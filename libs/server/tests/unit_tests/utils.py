@@ -1,8 +1,179 @@
-from typing import Any
+import json
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional
 
+from starlette.types import ASGIApp, Message
 
-class AnyStr:
-    """A type that matches any string."""
+from universal_tool_server.auth import Auth
+
+API_KEY_HEADER = b"x-api-key"
+
+# Request headers carrying each API key used by the tests. Shared, do not mutate.
+AUTH_HEADERS = {api_key: {"x-api-key": api_key} for api_key in ("1", "2", "3", "6")}
+
+# Users returned by the test authenticators, keyed by API key.
+API_KEY_TO_USER = MappingProxyType(
+    {
+        b"1": {"permissions": ["group1"], "identity": "some-user"},
+        b"2": {"permissions": ["group2"], "identity": "another-user"},
+    }
+)
+API_KEY_TO_AUTHORIZED_USER = MappingProxyType(
+    {
+        b"1": {"permissions": ["authorized"], "identity": "some-user"},
+        b"2": {"permissions": ["authorized"], "identity": "another-user"},
+        b"3": {"permissions": ["not-authorized"], "identity": "not-authorized"},
+    }
+)
+
+# Tools as listed by the server.
+SAY_HELLO_SPEC = {
+    "description": "Say hello.",
+    "id": "say_hello@1.0.0",
+    "input_schema": {"properties": {}, "type": "object"},
+    "name": "say_hello",
+    "output_schema": {"type": "string"},
+    "version": "1.0.0",
+}
+ECHO_SPEC = {
+    "description": "Echo the message back.",
+    "id": "echo@1.0.0",
+    "input_schema": {
+        "properties": {"msg": {"type": "string"}},
+        "required": ["msg"],
+        "type": "object",
+    },
+    "name": "echo",
+    "output_schema": {"type": "string"},
+    "version": "1.0.0",
+}
+ADD_SPEC = {
+    "description": "Add two integers.",
+    "id": "add@1.0.0",
+    "input_schema": {
+        "properties": {"x": {"type": "integer"}, "y": {"type": "integer"}},
+        "required": ["x", "y"],
+        "type": "object",
+    },
+    "name": "add",
+    "output_schema": {"type": "integer"},
+    "version": "1.0.0",
+}
+MULTIPLY_SPEC = {
+    "description": "Multiply two numbers.",
+    "id": "multiply@1.0.0",
+    "input_schema": {
+        "properties": {"a": {"type": "integer"}, "b": {"type": "integer"}},
+        "required": ["a", "b"],
+        "type": "object",
+    },
+    "name": "multiply",
+    "output_schema": {"type": "integer"},
+    "version": "1.0.0",
+}
+
+
+class _AnyStr:
+    """Matches any string."""
+
+    __slots__ = ()
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, str)
+
+    def __hash__(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return "AnyStr"
+
+
+# Shared instance, compared against without creating a new matcher each time.
+AnyStr = _AnyStr()
+
+
+def make_auth(users: Mapping[bytes, dict]) -> Auth:
+    """Create an Auth that authenticates requests by their API key."""
+    auth = Auth()
+
+    @auth.authenticate
+    async def authenticate(headers: dict[bytes, bytes]) -> dict:
+        """Authenticate incoming requests."""
+        # Validate credentials (e.g., API key, JWT token)
+        user = users.get(headers.get(API_KEY_HEADER))
+        if user is None:
+            raise auth.exceptions.HTTPException(detail="Not authorized")
+        return user
+
+    return auth
+
+
+class ASGIResponse(NamedTuple):
+    """Response captured from a direct call to an ASGI app."""
+
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+# Parts of the ASGI scope that are the same for every call. Do not mutate.
+_BASE_SCOPE = MappingProxyType(
+    {
+        "type": "http",
+        "asgi": MappingProxyType({"version": "3.0"}),
+        "http_version": "1.1",
+        "scheme": "http",
+        "query_string": b"",
+        "root_path": "",
+        "client": ("127.0.0.1", 123),
+        "server": ("localhost", 80),
+    }
+)
+
+
+async def call_asgi(
+    app: ASGIApp, method: str, path: str, json_body: Optional[Any] = None
+) -> ASGIResponse:
+    """Call an ASGI app directly, without going through an HTTP client."""
+    headers = [(b"host", b"localhost")]
+    if json_body is None:
+        body = b""
+    else:
+        body = json.dumps(json_body).encode()
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode()))
+    scope = {
+        **_BASE_SCOPE,
+        "method": method,
+        "path": path,
+        "raw_path": path.encode(),
+        "headers": headers,
+    }
+    request_sent = False
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    messages: list[Message] = []
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = messages[0]
+    return ASGIResponse(
+        status_code=start["status"],
+        headers=start.get("headers", []),
+        body=b"".join(
+            message.get("body", b"")
+            for message in messages
+            if message["type"] == "http.response.body"
+        ),
+    )
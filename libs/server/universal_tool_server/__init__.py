@@ -1,5 +1,6 @@
+import sys
 from contextlib import asynccontextmanager
-from typing import Callable, Optional, Tuple, TypeVar, Union, overload
+from typing import Callable, Optional, Sequence, Tuple, TypeVar, Union, overload
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
@@ -13,7 +14,8 @@ from universal_tool_server.auth.middleware import (
     ServerAuthenticationBackend,
     on_auth_error,
 )
-from universal_tool_server.splash import SPLASH
+from universal_tool_server.responses import ORJSONResponse
+from universal_tool_server.splash import SPLASH, SPLASH_BYTES
 from universal_tool_server.tools import (
     InjectedRequest,
     ToolHandler,
@@ -23,6 +25,10 @@ from universal_tool_server.tools import (
 
 T = TypeVar("T", bound=Callable)
 
+# The root routes do not depend on the server, so every server shares the same
+# route objects instead of rebuilding them through `include_router`.
+_ROOT_ROUTES = tuple(root.router.routes)
+
 
 class Server:
     """LangChain tool server."""
@@ -35,7 +41,13 @@ class Server:
         @asynccontextmanager
         async def full_lifespan(app: FastAPI):
             """A lifespan event that is called when the server starts."""
-            print(SPLASH)
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is None:
+                print(SPLASH)
+            else:
+                sys.stdout.flush()
+                buffer.write(SPLASH_BYTES)
+                sys.stdout.flush()
             # yield whatever is inside the context manager
             if lifespan:
                 async with lifespan(app) as stateful:
@@ -47,12 +59,13 @@ class Server:
             version=__version__,
             lifespan=full_lifespan,
             title="Universal Tool Server",
+            default_response_class=ORJSONResponse,
         )
 
         # Add a global exception handler for validation errors
         self.app.exception_handler(RequestValidationError)(validation_exception_handler)
         # Routes that go under `/`
-        self.app.include_router(root.router)
+        self.app.router.routes.extend(_ROOT_ROUTES)
         # Create a tool handler
         self.tool_handler = ToolHandler()
         # Routes that go under `/tools`
@@ -60,6 +73,7 @@ class Server:
         self.app.include_router(router, prefix="/tools")
 
         self._auth = Auth()
+        self._lifespan = lifespan
         # Also create the tool handler.
         # For now, it's a global that's referenced by both MCP and /tools router
         # Routes that go under `/mcp` (Model Context Protocol)
@@ -131,6 +145,41 @@ class Server:
             return decorator(fn)
         return decorator
 
+    def add_tools(
+        self,
+        tools: Sequence[Callable],
+        *,
+        permissions: list[str] | None = None,
+        version: Union[int, str, Tuple[int, int, int]] = (1, 0, 0),
+    ) -> None:
+        """Add several tools to the server at once.
+
+        Either all tools are added or, if any of them fails to register, none is.
+
+        Example:
+
+            async def echo(msg: str) -> str:
+                return msg + "!"
+
+            async def add(x: int, y: int) -> int:
+                return x + y
+
+            app.add_tools([echo, add])
+        """
+        self.tool_handler.add_many(tools, permissions=permissions, version=version)
+
+    def clone(self) -> "Server":
+        """Create a new server with the same configuration and tools.
+
+        The registered tools are reused as is, without building their schemas
+        again. Tools added to either server afterwards are not visible to the
+        other one. Authentication is not copied.
+        """
+        server = Server(lifespan=self._lifespan, enable_mcp=self._enable_mcp)
+        for registered_tool in self.tool_handler.catalog.values():
+            server.tool_handler._register(registered_tool)
+        return server
+
     def add_auth(self, auth: Auth) -> None:
         """Add an authentication handler to the server."""
         if not isinstance(auth, Auth):
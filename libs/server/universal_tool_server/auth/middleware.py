@@ -13,7 +13,7 @@ from starlette.authentication import (
 from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException
 from starlette.requests import HTTPConnection, Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
 
 from universal_tool_server.auth import Auth
 
@@ -41,6 +41,7 @@ class ServerAuthenticationBackend(AuthenticationBackend):
         self.auth = auth
         self._fn = None
         self._param_names = None
+        self._extract_arguments = None
 
     @property
     def fn(self) -> Callable:
@@ -53,15 +54,20 @@ class ServerAuthenticationBackend(AuthenticationBackend):
         return self._fn
 
     @property
-    def param_names(self) -> set[str]:
+    def param_names(self) -> frozenset[str]:
         if self._param_names is None:
-            self._param_names = (
-                _get_named_arguments(self.fn, supported_params=SUPPORTED_PARAMETERS)
-                if self.fn
-                else None
-            )
+            # Inspect the handler itself: for sync handlers, `fn` wraps it in
+            # `run_in_threadpool`, which hides its signature.
+            handler = self.auth._authenticate_handler
+            self._param_names = _get_named_arguments(handler) if handler else None
         return self._param_names
 
+    @property
+    def extract_arguments(self) -> Callable[[dict[str, Any]], dict[str, Any]]:
+        if self._extract_arguments is None:
+            self._extract_arguments = _make_arguments_extractor(self.param_names)
+        return self._extract_arguments
+
     async def authenticate(
         self, conn: HTTPConnection
     ) -> tuple[AuthCredentials, BaseUser] | None:
@@ -69,9 +75,7 @@ class ServerAuthenticationBackend(AuthenticationBackend):
         if self.fn is None:
             return None
         try:
-            args = _extract_arguments_from_scope(
-                conn.scope, self.param_names, request=Request(conn.scope)
-            )
+            args = self.extract_arguments(conn.scope)
             response = await self.fn(**args)
             return _normalize_auth_response(response)
         except AuthenticationError:
@@ -86,70 +90,171 @@ class ServerAuthenticationBackend(AuthenticationBackend):
             raise
 
 
-def _extract_arguments_from_scope(
-    scope: dict[str, Any],
-    param_names: set[str],
-    request: Request | None = None,
-    response: Response | None = None,
-) -> dict[str, Any]:
-    """Extract requested arguments from the ASGI scope (and request/response if needed)."""
+_MISSING = object()
+
+
+class _LazyHeaders(dict):
+    """Dict of the raw ASGI headers, keyed by raw header name, filled on demand.
+
+    Looking up a header scans the raw list rather than building a dict of every
+    header. The dict is only filled once it is used in any other way, e.g.,
+    iterated over, compared or modified. As with a dict built from the list, the
+    last value wins for repeated headers.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: Any) -> None:
+        self._raw = raw
+
+    def _fill(self) -> None:
+        if self._raw is not None:
+            dict.update(self, self._raw)
+            self._raw = None
+
+    def __getitem__(self, key: bytes) -> bytes:
+        if self._raw is None:
+            return dict.__getitem__(self, key)
+        found = _MISSING
+        for name, value in self._raw:
+            if name == key:
+                found = value
+        if found is _MISSING:
+            raise KeyError(key)
+        return found
 
+    def get(self, key: bytes, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        if self._raw is None:
+            return dict.__contains__(self, key)
+        return any(name == key for name, _ in self._raw)
+
+    def __reduce__(self) -> tuple:
+        return type(self), (list(self.items()),)
+
+
+def _filling(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self: _LazyHeaders, *args: Any, **kwargs: Any) -> Any:
+        self._fill()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+# Everything else reads or writes the dict itself, so it is filled first.
+for _name in (
+    "__iter__",
+    "__reversed__",
+    "__len__",
+    "__eq__",
+    "__ne__",
+    "__repr__",
+    "__or__",
+    "__ror__",
+    "__ior__",
+    "__setitem__",
+    "__delitem__",
+    "keys",
+    "values",
+    "items",
+    "copy",
+    "pop",
+    "popitem",
+    "setdefault",
+    "update",
+    "clear",
+):
+    setattr(_LazyHeaders, _name, _filling(getattr(dict, _name)))
+
+
+def _get_scopes(scope: dict[str, Any]) -> list[str]:
     auth = scope.get("auth")
-    args: dict[str, Any] = {}
-    if "scope" in param_names:
-        args["scope"] = scope
-    if "request" in param_names and request is not None:
-        args["request"] = request
-    if "response" in param_names and response is not None:
-        args["response"] = response
-    if "user" in param_names:
-        user = scope.get("user")
-        args["user"] = user
-    if "scopes" in param_names:
-        args["scopes"] = auth.scopes if auth else []
-    if "path_params" in param_names:
-        args["path_params"] = scope.get("path_params", {})
-    if "path" in param_names:
-        args["path"] = scope["path"]
-    if "query_params" in param_names:
-        args["query_params"] = scope.get("query_params", {})
-    if "headers" in param_names:
-        args["headers"] = dict(scope.get("headers", {}))
-    if "authorization" in param_names:
-        headers = dict(scope.get("headers", {}))
-        authorization = headers.get(b"authorization") or headers.get(b"Authorization")
-        if isinstance(authorization, bytes):
-            authorization = authorization.decode(encoding="utf-8")
-        args["authorization"] = authorization
-    if "method" in param_names:
-        args["method"] = scope.get("method")
-
-    return args
+    return auth.scopes if auth else []
+
+
+def _get_authorization(scope: dict[str, Any]) -> str | None:
+    # ASGI servers send header names lowercased, so the raw headers are scanned
+    # for an exact match instead of building a dict of all of them. As with the
+    # dict, the last value wins, and an empty value counts as missing.
+    authorization = None
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            authorization = value
+    return authorization.decode(encoding="utf-8") if authorization else None
+
+
+# How each argument of the authentication handler is read from the ASGI scope,
+# in the order they are extracted. The Request is only built for handlers that
+# take it.
+_ARGUMENT_GETTERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "scope": lambda scope: scope,
+    "request": Request,
+    "user": lambda scope: scope.get("user"),
+    "scopes": _get_scopes,
+    "path_params": lambda scope: scope.get("path_params", {}),
+    "path": lambda scope: scope["path"],
+    "query_params": lambda scope: scope.get("query_params", {}),
+    "headers": lambda scope: _LazyHeaders(scope.get("headers", ())),
+    "authorization": _get_authorization,
+    "method": lambda scope: scope.get("method"),
+}
+
+
+def _make_arguments_extractor(
+    param_names: frozenset[str],
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Build a function extracting the requested arguments from the ASGI scope.
+
+    Only the getters for the requested arguments are kept, so nothing is checked
+    or computed per request for the arguments the handler does not take.
+    """
+    getters = tuple(
+        (name, getter)
+        for name, getter in _ARGUMENT_GETTERS.items()
+        if name in param_names
+    )
+
+    def extract(scope: dict[str, Any]) -> dict[str, Any]:
+        return {name: getter(scope) for name, getter in getters}
+
+    return extract
 
 
 class DotDict:
+    __slots__ = ("_dict", "_nested")
+
     def __init__(self, dictionary: dict[str, Any]):
         self._dict = dictionary
-        for key, value in dictionary.items():
-            if isinstance(value, dict):
-                setattr(self, key, DotDict(value))
-            else:
-                setattr(self, key, value)
+        # Nested dicts are wrapped on first attribute access rather than upfront.
+        self._nested: dict[str, DotDict] = {}
 
     def __getattr__(self, name):
+        if name in DotDict.__slots__:
+            # Not set yet, e.g., while being copied. Looking it up in `_dict`
+            # would recurse.
+            raise AttributeError(name)
         if name not in self._dict:
             raise AttributeError(f"'DotDict' object has no attribute '{name}'")
-        return self._dict[name]
+        value = self._dict[name]
+        if not isinstance(value, dict):
+            return value
+        nested = self._nested.get(name)
+        # Wrap again if the value was replaced since it was last wrapped.
+        if nested is None or nested._dict is not value:
+            nested = self._nested[name] = DotDict(value)
+        return nested
 
     def __getitem__(self, key):
         return self._dict[key]
 
     def __setitem__(self, key, value):
         self._dict[key] = value
-        if isinstance(value, dict):
-            setattr(self, key, DotDict(value))
-        else:
-            setattr(self, key, value)
 
     def __deepcopy__(self, memo):
         return DotDict(copy.deepcopy(self._dict))
@@ -167,6 +272,8 @@ class ProxyUser(BaseUser):
     3. Proxy all other attributes to the underlying user object
     """
 
+    __slots__ = ("_user",)
+
     def __init__(self, user: Any):
         if not hasattr(user, "identity"):
             raise ValueError("User must have an identity property")
@@ -218,10 +325,15 @@ class ProxyUser(BaseUser):
 
     def __getattr__(self, name: str) -> Any:
         """Proxy any other attributes to the underlying user object."""
+        if name == "_user":
+            # Not set yet, e.g., while being copied.
+            raise AttributeError(name)
         return getattr(self._user, name)
 
 
 class SimpleUser(ProxyUser):
+    __slots__ = ()
+
     def __init__(self, username: str):
         super().__init__(DotDict({"identity": username}))
 
@@ -265,26 +377,30 @@ def normalize_user(user: Any) -> BaseUser:
     )
 
 
-def _get_named_arguments(fn: Callable, supported_params: dict) -> set[str]:
-    """Get the named arguments that a function accepts, ensuring they're supported."""
+@functools.lru_cache(maxsize=None)
+def _get_named_arguments(fn: Callable) -> frozenset[str]:
+    """Get the named arguments that a function accepts, ensuring they're supported.
+
+    Cached per function, since handlers are inspected again by every backend.
+    """
     sig = inspect.signature(fn)
     # Check for unsupported required parameters
     unsupported = []
     for name, param in sig.parameters.items():
-        if name not in supported_params and param.default is param.empty:
+        if name not in SUPPORTED_PARAMETERS and param.default is param.empty:
             unsupported.append(name)
 
     if unsupported:
         supported_str = "\n".join(
             f"  - {name} ({getattr(typ, '__name__', str(typ))})"
-            for name, typ in supported_params.items()
+            for name, typ in SUPPORTED_PARAMETERS.items()
         )
         raise ValueError(
             f"Handler has unsupported required parameters: {', '.join(unsupported)}.\n"
             f"Supported parameters are:\n{supported_str}"
         )
 
-    return {p for p in sig.parameters if p in supported_params}
+    return frozenset(p for p in sig.parameters if p in SUPPORTED_PARAMETERS)
 
 
 def on_auth_error(request: Request, exc: AuthenticationError) -> JSONResponse:
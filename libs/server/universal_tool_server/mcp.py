@@ -5,8 +5,9 @@ from itertools import chain
 from typing import TYPE_CHECKING, Any, Sequence
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
+from universal_tool_server.responses import ORJSONResponse
 from universal_tool_server.tools import CallToolRequest, ToolHandler
 
 if TYPE_CHECKING:
@@ -55,7 +56,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
     @router.get("/mcp/")
     async def mcp_get_handler():
         """Handle GET requests to MCP root - capabilities endpoint"""
-        return JSONResponse({
+        return ORJSONResponse({
             "jsonrpc": "2.0", 
             "result": {
                 "capabilities": {
@@ -71,7 +72,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
         try:
             body = await request.json()
         except Exception:
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "error": {
                     "code": -32700,
@@ -84,7 +85,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
 
         if method == "initialize":
             # Handle MCP initialization
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {
@@ -100,30 +101,16 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
             })
 
         elif method == "notifications/initialized":
-            # Handle initialization notification (no response needed)
-            return JSONResponse({"jsonrpc": "2.0"})
+            # Notifications get no response: Streamable HTTP expects 202 Accepted
+            return Response(status_code=202)
 
         elif method == "tools/list":
-            # Return list of available tools
-            tools_list = []
-            
-            # Get tools from the tool handler
-            tools = await tool_handler.list_tools(request=None)
-            
-            for tool in tools:
-                # Only return latest version of each tool
-                if tool_handler.latest_version[tool["name"]]["id"] == tool["id"]:
-                    tools_list.append({
-                        "name": tool["name"],
-                        "description": tool["description"],
-                        "inputSchema": tool["input_schema"]
-                    })
-
-            return JSONResponse({
+            # Return the latest version of each tool that MCP clients can call
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {
-                    "tools": tools_list
+                    "tools": tool_handler.list_mcp_tools()
                 }
             })
 
@@ -142,7 +129,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
                 response = await tool_handler.call_tool(call_tool_request, request=None)
                 
                 if not response["success"]:
-                    return JSONResponse({
+                    return ORJSONResponse({
                         "jsonrpc": "2.0",
                         "id": request_id,
                         "error": {
@@ -154,7 +141,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
                 # Convert result to MCP content format
                 content_items = _convert_to_content(response["value"])
                 
-                return JSONResponse({
+                return ORJSONResponse({
                     "jsonrpc": "2.0",
                     "id": request_id,
                     "result": {
@@ -169,7 +156,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
                 })
 
             except Exception as e:
-                return JSONResponse({
+                return ORJSONResponse({
                     "jsonrpc": "2.0",
                     "id": request_id,
                     "error": {
@@ -179,7 +166,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
                 })
 
         else:
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "error": {
@@ -0,0 +1,47 @@
+import json
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for types orjson does not serialize natively."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return jsonable_encoder(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON the same way `ORJSONResponse` renders it.
+
+    Content that orjson refuses is rendered like `JSONResponse` would instead.
+    """
+    try:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    except orjson.JSONEncodeError:
+        # orjson rejects some content that the standard encoder handles, e.g.,
+        # integers outside of the 64-bit range.
+        return json.dumps(
+            jsonable_encoder(content),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Content that orjson cannot serialize natively (e.g., pydantic models or sets)
+    is converted with FastAPI's `jsonable_encoder`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -3,6 +3,7 @@ from fastapi.responses import HTMLResponse
 from typing_extensions import TypedDict
 
 from universal_tool_server._version import __version__
+from universal_tool_server.responses import ORJSONResponse
 
 from .splash import SPLASH
 
@@ -13,13 +14,12 @@ class InfoResponse(TypedDict):
     version: str
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.get("/", response_class=HTMLResponse)
-async def index() -> str:
-    SPLASH_HTML = SPLASH.replace("\n", "<br>")
-    html_content = f"""
+_SPLASH_HTML = SPLASH.replace("\n", "<br>")
+# Nothing on the index page changes at runtime, so it is rendered once.
+_INDEX_HTML = f"""
     <html>
         <head>
             <title>Universal Tool Server</title>
@@ -27,7 +27,7 @@ async def index() -> str:
         <body>
         <div>
         <p style="white-space: pre-wrap; font-family: monospace;">
-            {SPLASH_HTML}
+            {_SPLASH_HTML}
         </p>
         </div>
         <div>
@@ -42,7 +42,10 @@ async def index() -> str:
     </html>
     """
 
-    return html_content
+
+@router.get("/", response_class=HTMLResponse)
+async def index() -> str:
+    return _INDEX_HTML
 
 
 @router.get("/info")
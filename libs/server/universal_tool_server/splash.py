@@ -21,3 +21,6 @@ SPLASH = """\
                 ███████║███████╗██║  ██║ ╚████╔╝ ███████╗██║  ██║
                 ╚══════╝╚══════╝╚═╝  ╚═╝  ╚═══╝  ╚══════╝╚═╝  ╚═╝
 """
+
+# Encoded once so startup writes skip the text encoder.
+SPLASH_BYTES = f"{SPLASH}\n".encode()
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import uuid
 from typing import (
     Any,
@@ -5,6 +7,8 @@ from typing import (
     Callable,
     Dict,
     Literal,
+    NamedTuple,
+    Sequence,
     Union,
     cast,
     get_type_hints,
@@ -14,7 +18,7 @@ import structlog
 from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from jsonschema_rs import validator_for
 from langchain_core.tools import BaseTool, InjectedToolArg, StructuredTool
 from langchain_core.tools import tool as tool_decorator
@@ -22,6 +26,8 @@ from langchain_core.utils.function_calling import convert_to_openai_function
 from pydantic import BaseModel, Field, TypeAdapter
 from typing_extensions import NotRequired, TypedDict
 
+from universal_tool_server.responses import ORJSONResponse, dumps
+
 
 class RegisteredTool(TypedDict):
     """A registered tool."""
@@ -34,11 +40,18 @@ class RegisteredTool(TypedDict):
     """Description of the tool."""
     input_schema: Dict[str, Any]
     """Input schema of the tool."""
+    validator: Any
+    """Validator compiled from the input schema at registration time.
+
+    None for tools without input, which accept any object.
+    """
     output_schema: Dict[str, Any]
     """Output schema of the tool."""
     fn: Callable[[Dict[str, Any]], Awaitable[Any]]
     """Function to call the tool."""
-    permissions: set[str]
+    invoke: Callable[[Dict[str, Any], Request | None], Awaitable[Any]]
+    """Calls `fn` with validated arguments, injecting the Request where needed."""
+    permissions: frozenset[str]
     """Scopes required to call the tool.
 
     If empty, not permissions are required and the tool is considered to be public.
@@ -50,6 +63,12 @@ class RegisteredTool(TypedDict):
 
     would have an entry in the `accepts` list as ("request", Request).
     """
+    definition: "ToolDefinition"
+    """Definition of the tool as returned by the list tools endpoint."""
+    needs_request: bool
+    """Whether the fn accepts the Request object."""
+    request_arg_names: tuple[str, ...]
+    """Names of the arguments that the Request object is injected into."""
     version: tuple[int, int, int]
     """Version of the tool. Allows for semver versioning of tools.
 
@@ -59,23 +78,32 @@ class RegisteredTool(TypedDict):
     """
 
 
+# Shared by every public tool.
+_EMPTY_PERMISSIONS: frozenset[str] = frozenset()
+
+# Maximum number of encoded tool lists kept by a ToolHandler. With auth enabled
+# there is one entry per distinct set of scopes seen.
+_MAX_ENCODED_LISTS = 128
+
+
 def _is_allowed(
     tool: RegisteredTool, request: Request | None, auth_enabled: bool
 ) -> bool:
     """Check if the request has required permissions to see / use the tool."""
-    required_permissions = tool["permissions"]
-
     # If tool requests Request object, but one is not provided, then the tool is not
     # allowed.
-    for _, type_ in tool["accepts"]:
-        if type_ is Request and request is None:
-            return False
+    if tool["needs_request"] and request is None:
+        return False
 
-    if not auth_enabled or not required_permissions:
+    if not auth_enabled:
         # Used to avoid request.auth attribute access raising an assertion errors
         # when no auth middleware is enabled..
         return True
-    permissions = request.auth.scopes if hasattr(request, "auth") else set()
+
+    required_permissions = tool["permissions"]
+    if not required_permissions:
+        return True
+    permissions = request.auth.scopes if hasattr(request, "auth") else ()
     return required_permissions.issubset(permissions)
 
 
@@ -107,6 +135,19 @@ class CallToolFullRequest(BaseModel):
     request: CallToolRequest = Field(..., description="Request to call a tool.")
 
 
+class CallToolBatchRequest(BaseModel):
+    """Request to call several tools at once."""
+
+    protocol_schema: Union[Literal["urn:oxp:1.0"], str] = Field(
+        default="urn:oxp:1.0",
+        description="Protocol version.",
+        alias="$schema",
+    )
+    requests: list[CallToolRequest] = Field(
+        ..., description="Requests to call a tool, run concurrently."
+    )
+
+
 class ToolError(TypedDict):
     """Error message from the tool."""
 
@@ -210,6 +251,130 @@ def _normalize_version(
     return cast(tuple[int, int, int], version_tuple)
 
 
+def _make_invoke(
+    fn: Callable[[Dict[str, Any]], Awaitable[Any]],
+    request_arg_names: tuple[str, ...],
+) -> Callable[[Dict[str, Any], Request | None], Awaitable[Any]]:
+    """Specialize the call of a tool on the arguments the Request is injected into."""
+    if not request_arg_names:
+
+        async def invoke(args: Dict[str, Any], request: Request | None) -> Any:
+            return await fn(args)
+
+        return invoke
+
+    async def invoke_with_request(args: Dict[str, Any], request: Request | None) -> Any:
+        # Inject on a copy so the request payload is left untouched.
+        return await fn({**args, **dict.fromkeys(request_arg_names, request)})
+
+    return invoke_with_request
+
+
+class _CompiledTool(NamedTuple):
+    """Parts of a catalog entry that do not depend on the version or permissions."""
+
+    tool: BaseTool
+    input_schema: Dict[str, Any]
+    validator: Any
+    output_schema: Dict[str, Any]
+    accepts: tuple[tuple[str, Any], ...]
+    request_arg_names: tuple[str, ...]
+
+
+def _compile_tool(tool: BaseTool) -> _CompiledTool:
+    """Build the schemas of a tool and find the arguments the Request goes into."""
+    from pydantic import BaseModel
+
+    if not issubclass(tool.args_schema, BaseModel):
+        raise NotImplementedError(
+            "Expected args_schema to be a Pydantic model. "
+            f"Got {type(tool.args_schema)}."
+            "This is not yet supported."
+        )
+
+    accepts = tuple(
+        (name, Request)
+        for name, field in tool.args_schema.model_fields.items()
+        if field.annotation is Request
+    )
+    input_schema = convert_to_openai_function(tool)["parameters"]
+    return _CompiledTool(
+        tool=tool,
+        input_schema=input_schema,
+        # A tool without input accepts any object, which the request model
+        # already ensures, so it has nothing to validate.
+        validator=validator_for(input_schema)
+        if input_schema.get("properties") or input_schema.get("required")
+        else None,
+        output_schema=get_output_schema(tool),
+        accepts=accepts,
+        request_arg_names=tuple(name for name, type_ in accepts if type_ is Request),
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_compile_callable(fn: Callable) -> _CompiledTool:
+    """Convert a function to a tool and compile it, once per function."""
+    return _compile_tool(tool_decorator(fn))
+
+
+def _create_registered_tool(
+    tool: Union[BaseTool, Callable],
+    *,
+    permissions: list[str] | None,
+    version: Union[int, str, tuple[int, int, int]],
+) -> RegisteredTool:
+    """Build the catalog entry for a tool, including its compiled schemas."""
+    if isinstance(tool, BaseTool):
+        compiled = _compile_tool(tool)
+    else:
+        # Plain functions are converted with the tool decorator. The result only
+        # depends on the function, so it is shared between registrations.
+        try:
+            hash(tool)
+        except TypeError:
+            compiled = _compile_tool(tool_decorator(tool))
+        else:
+            compiled = _cached_compile_callable(tool)
+
+    tool = compiled.tool
+    input_schema = compiled.input_schema
+    output_schema = compiled.output_schema
+    request_arg_names = compiled.request_arg_names
+
+    version = _normalize_version(version)
+    version_str = ".".join(map(str, version))
+    fn = cast(Callable[[Dict[str, Any]], Awaitable[Any]], tool.ainvoke)
+    invoke = _make_invoke(fn, request_arg_names)
+
+    registered_tool = {
+        "id": f"{tool.name}@{version_str}",
+        "name": tool.name,
+        "description": tool.description,
+        "input_schema": input_schema,
+        "validator": compiled.validator,
+        "output_schema": output_schema,
+        "fn": fn,
+        "invoke": invoke,
+        "permissions": frozenset(permissions) if permissions else _EMPTY_PERMISSIONS,
+        "accepts": list(compiled.accepts),
+        "needs_request": bool(request_arg_names),
+        "request_arg_names": request_arg_names,
+        # Register everything as version 1.0.0 for now.
+        "version": version,
+    }
+    registered_tool["definition"] = {
+        "id": registered_tool["id"],
+        "name": registered_tool["name"],
+        "description": registered_tool["description"],
+        "input_schema": input_schema,
+        "output_schema": output_schema,
+        "version": version_str,
+    }
+
+    return cast(RegisteredTool, registered_tool)
+
+
 class ToolHandler:
     def __init__(self) -> None:
         """Initializes the tool handler."""
@@ -217,6 +382,21 @@ class ToolHandler:
         self.auth_enabled = False
         # Mapping from tool name to the latest version of the tool.
         self.latest_version: Dict[str, RegisteredTool] = {}
+        # Definitions of every tool in the catalog, in registration order.
+        self._definitions: list[ToolDefinition] = []
+        # Definitions of the tools that can be called without a Request object.
+        self._definitions_without_request: list[ToolDefinition] = []
+        # Tools that require no permissions, in registration order.
+        self._public_tools: list[RegisteredTool] = []
+        # Mapping from a permission to the tools that require it.
+        self._tools_by_permission: Dict[str, list[RegisteredTool]] = {}
+        # Mapping from tool ID to its position in the catalog.
+        self._positions: Dict[str, int] = {}
+        # Tools as listed over MCP, built on first use and reset on registration.
+        self._mcp_tools: list[Dict[str, Any]] | None = None
+        # JSON encoded tool lists, keyed by what determines the tool visibility.
+        # Cleared whenever a tool is registered.
+        self._encoded_lists: Dict[tuple[bool, frozenset[str]], bytes] = {}
 
     def add(
         self,
@@ -233,56 +413,65 @@ class ToolHandler:
             version: Version of the tool.
             permissions: Permissions required to call the tool.
         """
-        # If not already a BaseTool, we'll convert it to one using
-        # the tool decorator.
-        if not isinstance(tool, BaseTool):
-            tool = tool_decorator(tool)
-
-        if isinstance(tool, BaseTool):
-            from pydantic import BaseModel
-
-            if not issubclass(tool.args_schema, BaseModel):
-                raise NotImplementedError(
-                    "Expected args_schema to be a Pydantic model. "
-                    f"Got {type(tool.args_schema)}."
-                    "This is not yet supported."
-                )
-
-            accepts = []
-            for name, field in tool.args_schema.model_fields.items():
-                if field.annotation is Request:
-                    accepts.append((name, Request))
-
-            output_schema = get_output_schema(tool)
-
-            version = _normalize_version(version)
-            version_str = ".".join(map(str, version))
-
-            registered_tool = {
-                "id": f"{tool.name}@{version_str}",
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": convert_to_openai_function(tool)["parameters"],
-                "output_schema": output_schema,
-                "fn": cast(Callable[[Dict[str, Any]], Awaitable[Any]], tool.ainvoke),
-                "permissions": cast(set[str], set(permissions or [])),
-                "accepts": accepts,
-                # Register everything as version 1.0.0 for now.
-                "version": version,
-            }
-        else:
-            raise AssertionError("Reached unreachable code")
-
+        registered_tool = _create_registered_tool(
+            tool, permissions=permissions, version=version
+        )
         if registered_tool["id"] in self.catalog:
             # Add unique ID to support duplicated tools?
             raise ValueError(f"Tool {registered_tool['id']} already exists")
+        self._register(registered_tool)
+
+    def add_many(
+        self,
+        tools: Sequence[Union[BaseTool, Callable]],
+        *,
+        permissions: list[str] | None = None,
+        version: Union[int, str, tuple[int, int, int]] = (1, 0, 0),
+    ) -> None:
+        """Register several tools in the catalog at once.
+
+        All tools are built and checked for conflicting IDs before any of them is
+        registered, so either every tool is added or none is.
+
+        Args:
+            tools: Implementations of the tools to register.
+            version: Version shared by the tools.
+            permissions: Permissions required to call each of the tools.
+        """
+        registered_tools = [
+            _create_registered_tool(tool, permissions=permissions, version=version)
+            for tool in tools
+        ]
+        seen = set(self.catalog)
+        for registered_tool in registered_tools:
+            if registered_tool["id"] in seen:
+                raise ValueError(f"Tool {registered_tool['id']} already exists")
+            seen.add(registered_tool["id"])
+        for registered_tool in registered_tools:
+            self._register(registered_tool)
+
+    def _register(self, registered_tool: RegisteredTool) -> None:
+        """Add a tool that is known not to conflict to the lookup structures."""
+        self._positions[registered_tool["id"]] = len(self.catalog)
         self.catalog[registered_tool["id"]] = registered_tool
+        self._encoded_lists.clear()
+        self._mcp_tools = None
+        if registered_tool["permissions"]:
+            for permission in registered_tool["permissions"]:
+                self._tools_by_permission.setdefault(permission, []).append(
+                    registered_tool
+                )
+        else:
+            self._public_tools.append(registered_tool)
+        self._definitions.append(registered_tool["definition"])
+        if not registered_tool["needs_request"]:
+            self._definitions_without_request.append(registered_tool["definition"])
         # Add the latest version of the tool to the latest_version mapping.
         name = registered_tool["name"]
         if name in self.latest_version:
             latest_version = self.latest_version[name]
             latest_version_version = latest_version["version"]
-            if version > latest_version_version:
+            if registered_tool["version"] > latest_version_version:
                 self.latest_version[name] = registered_tool
         else:
             self.latest_version[name] = registered_tool
@@ -343,55 +532,94 @@ class ToolHandler:
             )
 
         # Validate and parse the payload according to the tool's input schema.
-        fn = tool["fn"]
-
-        injected_arguments = {}
-
-        accepts = tool["accepts"]
-
-        for name, field in accepts:
-            if field is Request:
-                injected_arguments[name] = request
-
-        if isinstance(fn, Callable):
-            payload_schema_ = tool["input_schema"]
-            validator = validator_for(payload_schema_)
-            if not validator.is_valid(args):
-                raise HTTPException(
-                    status_code=400,
-                    detail=(
-                        f"Invalid payload for tool call to tool {tool_id} "
-                        f"with args {args} and schema {payload_schema_}",
-                    ),
-                )
-            # Update the injected arguments post-validation
-            args.update(injected_arguments)
-            tool_output = await fn(args)
-        else:
-            # This is an internal error
-            raise AssertionError(f"Invalid tool implementation: {type(fn)}")
+        # `fn` is always the tool's `ainvoke`, as set up by `add`.
+        # Tools without input have no validator, as any object is valid.
+        validator = tool["validator"]
+        if validator is not None and not validator.is_valid(args):
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Invalid payload for tool call to tool {tool_id} "
+                    f"with args {args} and schema {tool['input_schema']}",
+                ),
+            )
+        # The injected arguments are added post-validation.
+        tool_output = await tool["invoke"](args, request)
 
         return {"success": True, "call_id": str(call_id), "value": tool_output}
 
     async def list_tools(self, request: Request | None) -> list[ToolDefinition]:
-        """Lists all available tools in the catalog."""
-        # Incorporate default permissions for the tools.
-        tool_definitions = []
-
-        for tool in self.catalog.values():
-            if _is_allowed(tool, request, self.auth_enabled):
-                tool_definition = {
-                    "id": tool["id"],
-                    "name": tool["name"],
-                    "description": tool["description"],
-                    "input_schema": tool["input_schema"],
-                    "output_schema": tool["output_schema"],
-                    "version": ".".join(map(str, tool["version"])),
+        """Lists all available tools in the catalog.
+
+        The returned definitions are shared between calls and must not be mutated.
+        """
+        if not self.auth_enabled:
+            # Without auth, visibility only depends on whether a request is present.
+            if request is None:
+                return list(self._definitions_without_request)
+            return list(self._definitions)
+
+        # Look up the tools through the permissions index rather than checking
+        # every tool: a tool is visible once all of its permissions are granted.
+        permissions = request.auth.scopes if hasattr(request, "auth") else ()
+        visible = list(self._public_tools)
+        granted: Dict[str, int] = {}
+        for permission in set(permissions):
+            for tool in self._tools_by_permission.get(permission, ()):
+                count = granted.get(tool["id"], 0) + 1
+                granted[tool["id"]] = count
+                if count == len(tool["permissions"]):
+                    visible.append(tool)
+        if granted:
+            visible.sort(key=lambda tool: self._positions[tool["id"]])
+
+        return [
+            tool["definition"]
+            for tool in visible
+            if not (tool["needs_request"] and request is None)
+        ]
+
+    def list_mcp_tools(self) -> list[Dict[str, Any]]:
+        """Lists the tools exposed over MCP, in the shape used by `tools/list`.
+
+        Only the latest version of each tool is exposed. Tools that need the
+        Request object are left out since MCP clients cannot provide one. The list
+        is shared between calls and must not be mutated.
+        """
+        if self._mcp_tools is None:
+            latest_ids = frozenset(
+                latest["id"] for latest in self.latest_version.values()
+            )
+            self._mcp_tools = [
+                {
+                    "name": definition["name"],
+                    "description": definition["description"],
+                    "inputSchema": definition["input_schema"],
                 }
+                for definition in self._definitions_without_request
+                if definition["id"] in latest_ids
+            ]
+        return self._mcp_tools
 
-                tool_definitions.append(tool_definition)
+    async def list_tools_json(self, request: Request | None) -> bytes:
+        """Lists all available tools in the catalog, encoded as JSON.
+
+        The encoded list is cached per set of scopes until another tool is added.
+        """
+        if self.auth_enabled and hasattr(request, "auth"):
+            scopes = frozenset(request.auth.scopes)
+        else:
+            scopes = _EMPTY_PERMISSIONS
+        key = (request is not None, scopes)
 
-        return tool_definitions
+        encoded = self._encoded_lists.get(key)
+        if encoded is None:
+            encoded = dumps(await self.list_tools(request))
+            if len(self._encoded_lists) >= _MAX_ENCODED_LISTS:
+                # Evict the oldest entry.
+                del self._encoded_lists[next(iter(self._encoded_lists))]
+            self._encoded_lists[key] = encoded
+        return encoded
 
 
 class ValidationErrorResponse(TypedDict):
@@ -400,13 +628,26 @@ class ValidationErrorResponse(TypedDict):
     message: str
 
 
+def _check_protocol_schema(protocol_schema: str) -> None:
+    """Reject requests that use an unsupported protocol schema."""
+    if protocol_schema not in {"urn:oxp:1.0", "otc://1.0"}:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid protocol schema. Expected 'urn:oxp:1.0'.",
+        )
+
+
 def create_tools_router(tool_handler: ToolHandler) -> APIRouter:
     """Creates an API router for tools."""
     router = APIRouter()
 
+    # Handlers return ORJSONResponse directly so the payload is rendered by orjson
+    # without another pass through the response model. The return annotations
+    # still document the response shape.
     @router.get(
         "",
         operation_id="list-tools",
+        response_class=ORJSONResponse,
         responses={
             200: {"model": list[ToolDefinition]},
             422: {"model": ValidationErrorResponse},
@@ -414,19 +655,41 @@ def create_tools_router(tool_handler: ToolHandler) -> APIRouter:
     )
     async def list_tools(request: Request) -> list[ToolDefinition]:
         """Lists available tools."""
-        return await tool_handler.list_tools(request)
+        return Response(
+            await tool_handler.list_tools_json(request),
+            media_type="application/json",
+        )
 
-    @router.post("/call", operation_id="call-tool")
+    @router.post("/call", operation_id="call-tool", response_class=ORJSONResponse)
     async def call_tool(
         call_tool_request: CallToolFullRequest, request: Request
     ) -> CallToolResponse:
         """Call a tool by name with the provided payload."""
-        if call_tool_request.protocol_schema not in {"urn:oxp:1.0", "otc://1.0"}:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid protocol schema. Expected 'urn:oxp:1.0'.",
+        _check_protocol_schema(call_tool_request.protocol_schema)
+        return ORJSONResponse(
+            await tool_handler.call_tool(call_tool_request.request, request)
+        )
+
+    @router.post(
+        "/call/batch", operation_id="call-tools-batch", response_class=ORJSONResponse
+    )
+    async def call_tools_batch(
+        batch_request: CallToolBatchRequest, request: Request
+    ) -> list[CallToolResponse]:
+        """Call several tools concurrently.
+
+        The responses are returned in the order of the requests. If any of the
+        calls fails, the whole batch fails with that call's error.
+        """
+        _check_protocol_schema(batch_request.protocol_schema)
+        return ORJSONResponse(
+            await asyncio.gather(
+                *(
+                    tool_handler.call_tool(call_tool_request, request)
+                    for call_tool_request in batch_request.requests
+                )
             )
-        return await tool_handler.call_tool(call_tool_request.request, request)
+        )
 
     return router
 
@@ -454,30 +717,48 @@ class InjectedRequest(InjectedToolArg):
 logger = structlog.getLogger(__name__)
 
 
+def _compute_return_schema(fn: Callable) -> dict:
+    """Get the JSON schema of a function's return annotation."""
+    hints = get_type_hints(fn)
+    if "return" not in hints:
+        return {}  # Any type
+
+    return_type = TypeAdapter(hints["return"])
+    return return_type.json_schema()
+
+
+_cached_return_schema = functools.lru_cache(maxsize=512)(_compute_return_schema)
+
+
 def get_output_schema(tool: BaseTool) -> dict:
-    """Get the output schema."""
+    """Get the output schema.
+
+    Schemas are cached per underlying function, so the same dict is returned for
+    repeated calls and must not be mutated.
+    """
     try:
         if isinstance(tool, StructuredTool):
             if hasattr(tool, "coroutine") and tool.coroutine is not None:
-                hints = get_type_hints(tool.coroutine)
+                fn = tool.coroutine
             elif hasattr(tool, "func") and tool.func is not None:
-                hints = get_type_hints(tool.func)
+                fn = tool.func
             else:
                 raise ValueError(f"Invalid tool definition {tool}")
         elif isinstance(tool, BaseTool):
-            hints = get_type_hints(tool._run)
+            # Look up on the class: bound methods of (unhashable) tools can't be
+            # used as cache keys, and the type hints are the same.
+            fn = type(tool)._run
         else:
             raise ValueError(
                 f"Invalid tool definition {tool}. Expected a tool that was created "
                 f"using the @tool decorator or an instance of StructuredTool or BaseTool"
             )
 
-        if "return" not in hints:
-            return {}  # Any type
-
-        return_type = TypeAdapter(hints["return"])
-        json_schema = return_type.json_schema()
-        return json_schema
+        try:
+            hash(fn)
+        except TypeError:
+            return _compute_return_schema(fn)
+        return _cached_return_schema(fn)
     except Exception as e:
         logger.aerror(f"Error getting output schema: {e} for tool {tool}")
         # Generate a schema for any type
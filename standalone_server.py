@@ -10,10 +10,12 @@ import json
 import os
 from typing import Any, Dict, List, Optional, Union, Callable, TypeVar
 
-from fastapi import FastAPI, APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, Response
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
+from starlette.applications import Starlette
+from starlette.routing import Mount, Route
 import uvicorn
 
 T = TypeVar("T", bound=Callable)
@@ -75,15 +77,11 @@ class ToolHandler:
     async def call_tool(self, call_request: CallToolRequest, request=None):
         tool_name = call_request.tool_id
         
-        # Find tool by name
-        tool = None
-        for t in self.tools.values():
-            if t["name"] == tool_name:
-                tool = t
-                break
-        
-        if not tool:
+        # Resolve the tool by name via the registration-time index
+        latest = self.latest_version.get(tool_name)
+        if latest is None:
             return {"success": False, "error": f"Tool {tool_name} not found"}
+        tool = self.tools[latest["id"]]
         
         try:
             result = tool["function"](**call_request.input)
@@ -93,17 +91,17 @@ class ToolHandler:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-# MCP Router
-def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
-    """Create a FastAPI router for MCP endpoints."""
-    
-    router = APIRouter()
+# MCP Routes
+def create_mcp_routes(tool_handler: ToolHandler) -> List[Route]:
+    """Create bare Starlette routes for MCP endpoints.
+
+    These bypass FastAPI's dependency resolution and validation layer, which
+    has nothing to validate for raw JSON-RPC bodies.
+    """
 
-    @router.get("/mcp")
-    @router.get("/mcp/")
-    async def mcp_get_handler():
+    async def mcp_get_handler(request: Request):
         """Handle GET requests to MCP root - capabilities endpoint"""
-        return JSONResponse({
+        return ORJSONResponse({
             "jsonrpc": "2.0", 
             "result": {
                 "capabilities": {
@@ -112,14 +110,12 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
             }
         })
 
-    @router.post("/mcp")
-    @router.post("/mcp/")
     async def mcp_post_handler(request: Request):
         """Handle POST requests - MCP JSON-RPC messages"""
         try:
             body = await request.json()
         except Exception:
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "error": {
                     "code": -32700,
@@ -131,7 +127,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
         request_id = body.get("id")
 
         if method == "initialize":
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {
@@ -145,21 +141,25 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
             })
 
         elif method == "notifications/initialized":
-            return JSONResponse({"jsonrpc": "2.0"})
+            # Notifications get no response: Streamable HTTP expects 202 Accepted
+            return Response(status_code=202)
 
         elif method == "tools/list":
             tools_list = []
             tools = await tool_handler.list_tools(request=None)
+            latest_ids = frozenset(
+                latest["id"] for latest in tool_handler.latest_version.values()
+            )
             
             for tool in tools:
-                if tool_handler.latest_version[tool["name"]]["id"] == tool["id"]:
+                if tool["id"] in latest_ids:
                     tools_list.append({
                         "name": tool["name"],
                         "description": tool["description"],
                         "inputSchema": tool["input_schema"]
                     })
 
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {"tools": tools_list}
@@ -175,7 +175,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
                 response = await tool_handler.call_tool(call_tool_request, request=None)
                 
                 if not response["success"]:
-                    return JSONResponse({
+                    return ORJSONResponse({
                         "jsonrpc": "2.0",
                         "id": request_id,
                         "error": {
@@ -184,7 +184,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
                         }
                     })
 
-                return JSONResponse({
+                return ORJSONResponse({
                     "jsonrpc": "2.0",
                     "id": request_id,
                     "result": {
@@ -193,7 +193,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
                 })
 
             except Exception as e:
-                return JSONResponse({
+                return ORJSONResponse({
                     "jsonrpc": "2.0",
                     "id": request_id,
                     "error": {
@@ -203,7 +203,7 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
                 })
 
         else:
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "error": {
@@ -211,16 +211,28 @@ def create_mcp_router(tool_handler: ToolHandler) -> APIRouter:
                     "message": f"Method not found: {method}"
                 }
             }, status_code=400)
-    
-    return router
+
+    return [
+        Route(path, endpoint, methods=[method])
+        for path in ("/mcp", "/mcp/")
+        for method, endpoint in (("GET", mcp_get_handler), ("POST", mcp_post_handler))
+    ]
 
 # Main FastAPI app
-app = FastAPI(title="Universal Tool Server", version="1.0.0")
+api = FastAPI(
+    title="Universal Tool Server",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 tool_handler = ToolHandler()
 
-# Add MCP router
-mcp_router = create_mcp_router(tool_handler)
-app.include_router(mcp_router)
+# Top-level app: MCP routes are served directly, everything else goes to FastAPI
+app = Starlette(
+    routes=[
+        *create_mcp_routes(tool_handler),
+        Mount("/", app=api),
+    ]
+)
 
 # Tool decorator
 def add_tool(permissions: List[str] = None, version: str = "1.0.0"):
@@ -251,7 +263,7 @@ async def multiply(x: float, y: float) -> float:
     return x * y
 
 # Root endpoint
-@app.get("/")
+@api.get("/")
 async def root():
     return {"message": "Universal Tool Server", "mcp_endpoint": "/mcp"}
 